@@ -0,0 +1,238 @@
+import gc
+import itertools
+import multiprocessing
+import struct
+import zlib
+from multiprocessing import shared_memory
+
+import cooking_engine
+from cooking_engine import CookingEngine, CookingEvent, CookingSession, MonotonicClock
+
+MAGIC = b"CXAC"
+VERSION = 2
+HEADER = struct.Struct("<4sHH")
+HEADER_SIZE = 16
+SEQUENCE = struct.Struct("<I")
+CHECKSUM = struct.Struct("<II")
+PAYLOAD = struct.Struct("<IB3xIddd")
+RECORD_SIZE = CHECKSUM.size + PAYLOAD.size
+READ_ATTEMPTS = 64
+
+KINDS = (None, cooking_engine.CONNECTING, cooking_engine.PROGRESS, cooking_engine.FINISHED, cooking_engine.STOPPED)
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS) if kind is not None}
+
+class StateBlock:
+    def __init__(self, buffer, slots):
+        self.buffer = buffer
+        self.slots = slots
+        self.sequences = [0] * slots
+
+    @staticmethod
+    def size(slots):
+        return HEADER_SIZE + slots * RECORD_SIZE
+
+    def initialize(self):
+        self.buffer[:self.size(self.slots)] = bytes(self.size(self.slots))
+        HEADER.pack_into(self.buffer, 0, MAGIC, VERSION, self.slots)
+
+    # Python gives no memory fences, so on weakly ordered CPUs (the ARM
+    # boards) the sequence alone cannot prove a consistent read. Each record
+    # also carries a CRC of its payload; a torn or reordered read fails it and
+    # is retried.
+    def write(self, slot, session_id, kind, remaining, progress, elapsed, wakeup):
+        offset = HEADER_SIZE + slot * RECORD_SIZE
+        sequence = self.sequences[slot] + 1
+        payload = PAYLOAD.pack(session_id, KIND_CODES[kind], remaining, progress, elapsed, wakeup)
+        SEQUENCE.pack_into(self.buffer, offset, sequence)
+        self.buffer[offset + CHECKSUM.size:offset + RECORD_SIZE] = payload
+        CHECKSUM.pack_into(self.buffer, offset, sequence, zlib.crc32(payload))
+        self.sequences[slot] = sequence + 1
+        SEQUENCE.pack_into(self.buffer, offset, sequence + 1)
+
+    def read(self, slot, attempts=READ_ATTEMPTS):
+        offset = HEADER_SIZE + slot * RECORD_SIZE
+        for _ in range(attempts):
+            record = bytes(self.buffer[offset:offset + RECORD_SIZE])
+            sequence, checksum = CHECKSUM.unpack_from(record)
+            payload = record[CHECKSUM.size:]
+            if (
+                not sequence & 1
+                and zlib.crc32(payload) == checksum
+                and SEQUENCE.unpack_from(self.buffer, offset)[0] == sequence
+            ):
+                return (sequence,) + PAYLOAD.unpack(payload)
+        return None
+
+def run_controller(connection, name, slots):
+    memory = shared_memory.SharedMemory(name=name)
+    block = StateBlock(memory.buf, slots)
+    engine = CookingEngine(MonotonicClock())
+    sessions = {}
+
+    def publish(slot, session_id, event):
+        session = event.session
+        block.write(
+            slot,
+            session_id,
+            event.kind,
+            event.remaining,
+            event.progress,
+            event.progress * session.total_time,
+            session.wakeup or 0.0
+        )
+        if event.kind == cooking_engine.FINISHED:
+            sessions.pop(slot, None)
+
+    gc.collect()
+    gc.freeze()
+    try:
+        while True:
+            deadline = engine.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - engine.clock.now())
+            if connection.poll(timeout):
+                try:
+                    command = connection.recv()
+                except EOFError:
+                    break
+                if command[0] == "start":
+                    _, slot, session_id, recipe_name, recipe, connect_delay, elapsed = command
+                    sessions[slot] = engine.start(
+                        recipe_name,
+                        recipe,
+                        lambda event, slot=slot, session_id=session_id: publish(slot, session_id, event),
+                        connect_delay,
+                        elapsed
+                    )
+                elif command[0] == "stop":
+                    session = sessions.pop(command[1], None)
+                    if session is not None:
+                        engine.stop(session)
+                elif command[0] == "shutdown":
+                    break
+            engine.run_due()
+    finally:
+        del block
+        memory.close()
+
+class ProcessEngine:
+    def __init__(self, slots, clock=None, resolution=0.001, slack=0.002, retry=0.01):
+        self.clock = clock or MonotonicClock()
+        self.resolution = resolution
+        self.slack = slack
+        self.retry = retry
+        self.sessions = {}
+        self.observers = []
+        self.on_schedule = None
+        self.wakeups = 0
+        self._ids = itertools.count(1)
+        self._slots = [None] * slots
+
+        self.memory = shared_memory.SharedMemory(create=True, size=StateBlock.size(slots))
+        self.block = StateBlock(self.memory.buf, slots)
+        self.block.initialize()
+        context = multiprocessing.get_context("spawn")
+        self.connection, child = context.Pipe()
+        self.process = context.Process(
+            target=run_controller,
+            args=(child, self.memory.name, slots),
+            name="cook-controller",
+            daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def start(self, recipe_name, recipe, listener=None, connect_delay=1.0, elapsed=0.0):
+        if not self.process.is_alive():
+            raise RuntimeError("cook controller is not running")
+        if None not in self._slots:
+            raise RuntimeError("no free controller slot")
+        slot = self._slots.index(None)
+        now = self.clock.now()
+        session = CookingSession(next(self._ids), recipe_name, recipe, listener, now, connect_delay, self.observers, elapsed)
+        session.slot = slot
+        session.sequence = None
+        session.poll_at = session.wakeup + self.slack
+        try:
+            self.connection.send(("start", slot, session.session_id, recipe_name, recipe, connect_delay, elapsed))
+        except OSError as error:
+            raise RuntimeError(f"cook controller is not running: {error}") from error
+        self._slots[slot] = session
+        self.sessions[session.session_id] = session
+        session.emit(CookingEvent(cooking_engine.CONNECTING, session, now, elapsed / session.total_time, session.remaining(elapsed)))
+        self.notify()
+        return session
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        self.observers.remove(observer)
+
+    def stop(self, session):
+        if self.sessions.pop(session.session_id, None) is None:
+            return
+        self._slots[session.slot] = None
+        try:
+            self.connection.send(("stop", session.slot))
+        except OSError:
+            pass
+        session.state = cooking_engine.STOPPED
+        session.wakeup = None
+        session.emit(CookingEvent(cooking_engine.STOPPED, session, self.clock.now()))
+        self.notify()
+
+    def notify(self):
+        if self.on_schedule is not None:
+            self.on_schedule()
+
+    def next_deadline(self):
+        return min((session.poll_at for session in self.sessions.values()), default=None)
+
+    def run_due(self):
+        now = self.clock.now()
+        for session in list(self.sessions.values()):
+            if session.poll_at > now + self.resolution or session.session_id not in self.sessions:
+                continue
+            self.wakeups += 1
+            record = self.block.read(session.slot)
+            if record is None or record[1] != session.session_id or record[0] == session.sequence:
+                if not self.process.is_alive():
+                    self.stop(session)
+                    continue
+                session.poll_at = now + self.retry
+                continue
+            sequence, session_id, code, remaining, progress, elapsed, wakeup = record
+            session.sequence = sequence
+            session.state = KINDS[code]
+            session.due = elapsed
+            session.wakeup = wakeup or None
+            session.poll_at = wakeup + self.slack
+
+            if session.state == cooking_engine.FINISHED:
+                del self.sessions[session.session_id]
+                self._slots[session.slot] = None
+                session.emit(CookingEvent(cooking_engine.FINISHED, session, now, 1.0, 0, module_states=session.module_states(session.total_time)))
+            elif session.state == cooking_engine.PROGRESS:
+                active = [session.modules[slot.index] for slot in session.active_slots(elapsed)]
+                session.emit(CookingEvent(
+                    cooking_engine.PROGRESS,
+                    session,
+                    now,
+                    progress,
+                    remaining,
+                    active[0] if active else None,
+                    active,
+                    session.module_states(elapsed),
+                    session.timeline.module_progress(elapsed)
+                ))
+        return self.next_deadline()
+
+    def close(self):
+        try:
+            self.connection.send(("shutdown",))
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        del self.block
+        self.memory.close()
+        self.memory.unlink()
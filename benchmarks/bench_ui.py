@@ -0,0 +1,101 @@
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+
+from common import summarize, synthetic_catalog, virtual_display
+
+def timed(app, action):
+    started = time.perf_counter()
+    action()
+    app.root.update()
+    return time.perf_counter() - started
+
+def bench_catalog(size, repeat, ticks):
+    import user_interface
+    from recipe_store import RecipeStore
+
+    with tempfile.TemporaryDirectory() as catalog_dir:
+        synthetic_catalog(catalog_dir, size)
+
+        started = time.perf_counter()
+        RecipeStore(catalog_dir)
+        index_build = time.perf_counter() - started
+
+        startup, first_paint = [], []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            app = user_interface.LuxuryCookingApp(catalog_dir=catalog_dir, telemetry_path=None, journal_path=None, sensor_source=None)
+            first_paint.append(app.startup_timings["first_paint"])
+            app.root.update()
+            startup.append(time.perf_counter() - started)
+            app.root.destroy()
+
+        app = user_interface.LuxuryCookingApp(catalog_dir=catalog_dir, station_count=1, telemetry_path=None, journal_path=None, sensor_source=None)
+        app.root.update()
+        names = app.recipes.names()
+
+        detail_cold, detail_warm, cooking, cards = [], [], [], []
+        for i in range(repeat):
+            recipe_name = names[i % len(names)]
+            cached = ("detail", recipe_name) in app.view_cache
+            sample = timed(app, lambda: app.view_recipe_detail(recipe_name))
+            (detail_warm if cached else detail_cold).append(sample)
+            cooking.append(timed(app, app.start_cooking))
+            cards.append(timed(app, app.stop_cooking))
+        detail_warm.append(timed(app, lambda: app.view_recipe_detail(names[0])))
+
+        app.start_cooking()
+        app.root.update()
+        station = app.stations[0]
+        module = app.recipes.get(names[0]).modules
+        tick_costs = []
+        for i in range(ticks):
+            active = [module[i * len(module) // ticks]]
+            started = time.perf_counter()
+            app.update_cooking_ui(station, i / ticks, f"0:{59 - i % 60:02d}", active, ())
+            app.render_queue.flush()
+            app.root.update_idletasks()
+            tick_costs.append(time.perf_counter() - started)
+        app.stop_cooking()
+        app.root.destroy()
+
+    return {
+        "catalog_size": size,
+        "index_build": index_build,
+        "first_paint": summarize(first_paint),
+        "startup": summarize(startup),
+        "view_recipe_detail_cold": summarize(detail_cold),
+        "view_recipe_detail_warm": summarize(detail_warm),
+        "start_cooking": summarize(cooking),
+        "show_recipe_cards": summarize(cards),
+        "update_cooking_ui_tick": summarize(tick_costs)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup, view switches and cooking-screen ticks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    with virtual_display():
+        results = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "results": [bench_catalog(size, args.repeat, args.ticks) for size in args.sizes]
+        }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
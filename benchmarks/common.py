@@ -0,0 +1,70 @@
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+CATALOG_DIR = os.path.join(ROOT_DIR, "recipes")
+
+def synthetic_catalog(path, size):
+    from recipe_store import INDEX_FILE, INGREDIENTS_FILE
+
+    templates = []
+    for filename in sorted(os.listdir(CATALOG_DIR)):
+        if filename.endswith(".json") and filename not in (INDEX_FILE, INGREDIENTS_FILE):
+            with open(os.path.join(CATALOG_DIR, filename), encoding="utf-8") as f:
+                templates.append(json.load(f))
+
+    os.makedirs(path, exist_ok=True)
+    for i in range(size):
+        recipe = dict(templates[i % len(templates)])
+        if i >= len(templates):
+            recipe["name"] = f"{recipe['name']} #{i}"
+        with open(os.path.join(path, f"recipe_{i:05d}.json"), "w", encoding="utf-8") as f:
+            json.dump(recipe, f, ensure_ascii=False)
+    return path
+
+@contextlib.contextmanager
+def virtual_display(size="800x480x24"):
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise RuntimeError("no DISPLAY set and Xvfb is not installed")
+
+    display = f":{os.getpid() % 500 + 100}"
+    server = subprocess.Popen(
+        [xvfb, display, "-screen", "0", size, "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        os.environ["DISPLAY"] = display
+        for _ in range(50):
+            if os.path.exists(f"/tmp/.X11-unix/X{display[1:]}"):
+                break
+            time.sleep(0.1)
+        yield display
+    finally:
+        os.environ.pop("DISPLAY", None)
+        server.terminate()
+        server.wait()
+
+def summarize(samples):
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "count": count,
+        "min_ms": ordered[0] * 1000,
+        "median_ms": ordered[count // 2] * 1000,
+        "p95_ms": ordered[min(count - 1, int(count * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000
+    }
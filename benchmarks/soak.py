@@ -0,0 +1,181 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+from common import synthetic_catalog, virtual_display
+
+DEFAULT_LIMITS = {
+    "rss_mb": 16.0,
+    "objects": 20000,
+    "widgets": 50,
+    "after_callbacks": 10,
+    "tcl_commands": 200,
+    "threads": 2
+}
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        scale = 2 ** 20 if sys.platform == "darwin" else 2 ** 10
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+def sample(app, cycle, started):
+    import user_interface
+
+    gc.collect()
+    return {
+        "cycle": cycle,
+        "seconds": time.perf_counter() - started,
+        "rss_mb": rss_mb(),
+        "objects": len(gc.get_objects()),
+        "widgets": user_interface.ViewCache.count_widgets(app.root),
+        "after_callbacks": len(app.root.tk.splitlist(app.root.tk.call("after", "info"))),
+        "tcl_commands": len(app.root.tk.splitlist(app.root.tk.call("info", "commands"))),
+        "threads": threading.active_count()
+    }
+
+def settle(app, seconds, step=1.0):
+    clock = app.engine.clock
+    target = clock.now() + seconds
+    while clock.now() < target:
+        app.engine.run_until(min(target, clock.now() + step))
+        app.render_queue.flush()
+        app.root.update()
+
+def cycle(app, index, names):
+    recipe_name = names[index % len(names)]
+    if index % 10 == 0:
+        app.set_search(recipe_name.split()[0][:3])
+        app.root.update()
+        app.set_search("")
+
+    app.view_recipe_detail(recipe_name)
+    app.root.update()
+    app.start_cooking()
+    settle(app, 3)
+
+    if index % 3 == 0:
+        app.engine.run_until_idle()
+        app.render_queue.flush()
+        app.show_recipe_cards()
+    elif index % 3 == 1:
+        app.show_stations()
+        app.root.update()
+        app.open_station(app.stations[0])
+        app.stop_cooking()
+    else:
+        app.stop_cooking()
+    app.root.update()
+
+def growth(samples, key):
+    count = len(samples)
+    xs = [entry["cycle"] for entry in samples]
+    ys = [entry[key] for entry in samples]
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread if spread else 0.0
+    return {
+        "first": ys[0],
+        "last": ys[-1],
+        "per_1000_cycles": slope * 1000,
+        "projected": slope * (xs[-1] - xs[0])
+    }
+
+def soak(cycles, warmup, sample_every, catalog_size, limits, sensors=True, telemetry=True, journal=True):
+    import cooking_engine
+    import user_interface
+    from sensors import SimulatedSource
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        catalog_dir = synthetic_catalog(os.path.join(data_dir, "recipes"), catalog_size)
+        app = user_interface.LuxuryCookingApp(
+            catalog_dir=catalog_dir,
+            station_count=1,
+            telemetry_path=os.path.join(data_dir, "telemetry.bin") if telemetry else None,
+            journal_path=os.path.join(data_dir, "journal.log") if journal else None,
+            inventory_path=os.path.join(data_dir, "inventory.json"),
+            sensor_source=SimulatedSource if sensors else None
+        )
+        app.engine.clock = app.orders.clock = cooking_engine.SimulatedClock()
+        app.root.update()
+        names = app.recipes.names()
+
+        for index in range(warmup):
+            cycle(app, index, names)
+
+        started = time.perf_counter()
+        samples = [sample(app, 0, started)]
+        for index in range(1, cycles + 1):
+            cycle(app, warmup + index, names)
+            if index % sample_every == 0 or index == cycles:
+                samples.append(sample(app, index, started))
+        app.root.destroy()
+        app.close()
+
+    report = {key: growth(samples, key) for key in limits}
+    failures = [
+        f"{key} grew by {report[key]['projected']:.1f} (limit {limit})"
+        for key, limit in limits.items()
+        if report[key]["projected"] > limit
+    ]
+    return {
+        "cycles": cycles,
+        "warmup": warmup,
+        "catalog_size": catalog_size,
+        "subsystems": {"sensors": sensors, "telemetry": telemetry, "journal": journal},
+        "limits": limits,
+        "growth": report,
+        "failures": failures,
+        "samples": samples
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive navigate/cook/stop cycles and fail on resource growth.")
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--sample-every", type=int, default=50)
+    parser.add_argument("--catalog-size", type=int, default=100)
+    for key, limit in DEFAULT_LIMITS.items():
+        parser.add_argument(f"--max-{key.replace('_', '-')}", type=type(limit), default=limit, dest=f"max_{key}")
+    parser.add_argument("--no-sensors", action="store_true")
+    parser.add_argument("--no-telemetry", action="store_true")
+    parser.add_argument("--no-journal", action="store_true")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    limits = {key: getattr(args, f"max_{key}") for key in DEFAULT_LIMITS}
+    with virtual_display():
+        result = soak(
+            args.cycles,
+            args.warmup,
+            args.sample_every,
+            args.catalog_size,
+            limits,
+            not args.no_sensors,
+            not args.no_telemetry,
+            not args.no_journal
+        )
+    result.update({"python": sys.version.split()[0], "platform": platform.platform(), "timestamp": time.time()})
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    for failure in result["failures"]:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if result["failures"] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+
+MAX_BODY = 64 * 1024
+SHUTDOWN_GRACE = 1.0
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+def encode_event(key, state):
+    data = json.dumps({"station": key, "state": state}, ensure_ascii=False)
+    return f"event: station\ndata: {data}\n\n".encode("utf-8")
+
+class ControlServer:
+    def __init__(self, schedule, handlers, host="127.0.0.1", port=8765, unix_path=None, client_backlog=64):
+        self.schedule = schedule
+        self.handlers = handlers
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.client_backlog = client_backlog
+        self.snapshot = {}
+        self.subscribers = set()
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="control-server", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self.thread.join()
+            raise self._error
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            if self.unix_path:
+                self.server = loop.run_until_complete(asyncio.start_unix_server(self.handle, path=self.unix_path))
+            else:
+                self.server = loop.run_until_complete(asyncio.start_server(self.handle, self.host, self.port))
+        except Exception as error:
+            self._error = error
+            loop.close()
+            return
+        else:
+            self.loop = loop
+        finally:
+            self._ready.set()
+        loop.run_forever()
+        tasks = asyncio.all_tasks(loop)
+        if tasks:
+            _, pending = loop.run_until_complete(asyncio.wait(tasks, timeout=SHUTDOWN_GRACE))
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
+
+    def stop(self):
+        if self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self._shutdown)
+        self.thread.join(timeout=5)
+        self.loop = None
+
+    def _shutdown(self):
+        self.server.close()
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+        self.loop.stop()
+
+    def publish(self, key, state):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._broadcast, key, state)
+
+    def _broadcast(self, key, state):
+        self.snapshot.setdefault(key, {}).update(state)
+        if not self.subscribers:
+            return
+        payload = encode_event(key, state)
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    def call(self, name, *args):
+        future = concurrent.futures.Future()
+
+        def run():
+            try:
+                future.set_result(self.handlers[name](*args))
+            except Exception as error:
+                future.set_exception(error)
+
+        self.schedule(run)
+        return asyncio.wrap_future(future)
+
+    async def handle(self, reader, writer):
+        try:
+            method, path, body = await self.read_request(reader)
+            if method == "GET" and path == "/events":
+                await self.stream(writer)
+                return
+            status, payload = await self.route(method, path, body)
+        except (ValueError, KeyError) as error:
+            status, payload = 400, {"error": str(error)}
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        except Exception as error:
+            status, payload = 500, {"error": str(error)}
+
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n\r\n".encode("ascii") + body
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def read_request(self, reader):
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = lines[0].split(" ", 2)
+        length = 0
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        if length > MAX_BODY:
+            raise ValueError("request body too large")
+        body = json.loads(await reader.readexactly(length)) if length else {}
+        return method, target.split("?", 1)[0].rstrip("/") or "/", body
+
+    async def route(self, method, path, body):
+        parts = path.strip("/").split("/")
+        if path == "/recipes" and method == "GET":
+            return 200, await self.call("recipes")
+        if path == "/stations" and method == "GET":
+            return 200, [{"station": key, "state": state} for key, state in sorted(self.snapshot.items())]
+        if path == "/orders" and method == "POST":
+            return 200, await self.call("start", body["recipe"])
+        if len(parts) == 3 and parts[0] == "stations" and parts[2] == "stop" and method == "POST":
+            return 200, await self.call("stop", int(parts[1]))
+        if path in ("/recipes", "/stations", "/orders", "/events"):
+            return 405, {"error": f"{method} not allowed on {path}"}
+        return 404, {"error": f"no route for {path}"}
+
+    async def stream(self, writer):
+        queue = asyncio.Queue(self.client_backlog)
+        for key, state in sorted(self.snapshot.items()):
+            queue.put_nowait(encode_event(key, state))
+        self.subscribers.add(queue)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+        )
+        try:
+            while True:
+                payload = await queue.get()
+                if payload is None:
+                    break
+                writer.write(payload)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.subscribers.discard(queue)
+            writer.close()
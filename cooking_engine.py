@@ -0,0 +1,341 @@
+import heapq
+import itertools
+import math
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+
+CONNECTING = "connecting"
+PROGRESS = "progress"
+FINISHED = "finished"
+STOPPED = "stopped"
+
+MODULE_PENDING = "pending"
+MODULE_ACTIVE = "active"
+MODULE_DONE = "done"
+
+EPSILON = 1e-9
+TIMELINE_CACHE_SIZE = 64
+
+_timelines = OrderedDict()
+
+def format_remaining(seconds):
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+class MonotonicClock:
+    def now(self):
+        return time.monotonic()
+
+class SimulatedClock:
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def now(self):
+        return self.time
+
+    def advance_to(self, when):
+        if when > self.time:
+            self.time = when
+
+class CookingEvent:
+    def __init__(self, kind, session, time, progress=0.0, remaining=0, module=None, active=(), module_states=(), module_progress=()):
+        self.kind = kind
+        self.session = session
+        self.time = time
+        self.progress = progress
+        self.remaining = remaining
+        self.module = module
+        self.active = active
+        self.module_states = module_states
+        self.module_progress = module_progress
+
+    @property
+    def time_remaining(self):
+        return format_remaining(self.remaining)
+
+class ModuleSlot:
+    def __init__(self, index, module, start, end):
+        self.index = index
+        self.module = module
+        self.start = start
+        self.end = end
+
+def plan_modules(recipe):
+    modules = recipe.modules
+    default_duration = recipe.time * 60 / len(modules)
+    names = {module.name: index for index, module in enumerate(modules)}
+    if len(names) != len(modules):
+        raise ValueError(f"{recipe.name}: module names must be unique")
+
+    dependencies = []
+    for index, module in enumerate(modules):
+        after = module.after
+        if after is None:
+            after = (modules[index - 1].name,) if index > 0 else ()
+        for name in after:
+            if name not in names:
+                raise ValueError(f"{recipe.name}: {module.name} depends on unknown module {name}")
+        dependencies.append([names[name] for name in after])
+
+    ends = [None] * len(modules)
+    slots = [None] * len(modules)
+    while None in ends:
+        progressed = False
+        for index, module in enumerate(modules):
+            if ends[index] is not None or any(ends[dep] is None for dep in dependencies[index]):
+                continue
+            start = max((ends[dep] for dep in dependencies[index]), default=0.0)
+            ends[index] = start + (default_duration if module.duration is None else module.duration)
+            slots[index] = ModuleSlot(index, module, start, ends[index])
+            progressed = True
+        if not progressed:
+            raise ValueError(f"{recipe.name}: module dependencies form a cycle")
+    return slots
+
+class Timeline:
+    def __init__(self, slots):
+        self.slots = slots
+        self.total = max(slot.end for slot in slots)
+        self.boundaries = sorted({0.0, self.total}.union(*((slot.start, slot.end) for slot in slots)))
+        self.active = []
+        self.states = []
+        for start in self.boundaries[:-1]:
+            self.active.append(tuple(sorted(
+                (slot for slot in slots if slot.start <= start < slot.end),
+                key=lambda slot: slot.start
+            )))
+            self.states.append(tuple(
+                MODULE_DONE if slot.end <= start else MODULE_ACTIVE if slot.start <= start else MODULE_PENDING
+                for slot in slots
+            ))
+
+    def segment(self, elapsed):
+        index = bisect_right(self.boundaries, elapsed + EPSILON) - 1
+        return min(max(index, 0), len(self.active) - 1)
+
+    def active_slots(self, elapsed):
+        return self.active[self.segment(elapsed)]
+
+    def module_states(self, elapsed):
+        if elapsed >= self.total - EPSILON:
+            return (MODULE_DONE,) * len(self.slots)
+        return self.states[self.segment(elapsed)]
+
+    def module_progress(self, elapsed):
+        return tuple((elapsed - slot.start) / (slot.end - slot.start) for slot in self.active_slots(elapsed))
+
+    def remaining(self, elapsed):
+        return math.ceil(self.total - elapsed - EPSILON)
+
+    def next_boundary(self, elapsed):
+        return self.boundaries[self.segment(elapsed) + 1]
+
+def timeline_key(recipe):
+    return (
+        recipe.name,
+        recipe.time,
+        tuple((module.name, module.duration, module.after) for module in recipe.modules)
+    )
+
+def compile_timeline(recipe):
+    key = timeline_key(recipe)
+    timeline = _timelines.get(key)
+    if timeline is not None:
+        _timelines.move_to_end(key)
+        return timeline
+
+    timeline = _timelines[key] = Timeline(plan_modules(recipe))
+    if len(_timelines) > TIMELINE_CACHE_SIZE:
+        _timelines.popitem(last=False)
+    return timeline
+
+def plan_duration(recipe):
+    return compile_timeline(recipe).total
+
+def planned_minutes(recipe):
+    return round(plan_duration(recipe) / 60, 1)
+
+class CookingSession:
+    def __init__(self, session_id, recipe_name, recipe, listener, start_time, connect_delay, observers=(), elapsed=0.0):
+        self.session_id = session_id
+        self.recipe_name = recipe_name
+        self.recipe = recipe
+        self.modules = recipe.modules
+        self.timeline = compile_timeline(recipe)
+        self.slots = self.timeline.slots
+        self.total_time = self.timeline.total
+        self.listener = listener
+        self.observers = observers
+        self.start_time = start_time + connect_delay - elapsed
+        self.state = CONNECTING
+        self.due = elapsed
+        self.wakeup = self.start_time + elapsed
+
+    def active_slots(self, elapsed):
+        return self.timeline.active_slots(elapsed)
+
+    def module_states(self, elapsed):
+        return self.timeline.module_states(elapsed)
+
+    def remaining(self, elapsed):
+        return self.timeline.remaining(elapsed)
+
+    def next_transition(self, elapsed):
+        return min(self.total_time - (self.remaining(elapsed) - 1), self.timeline.next_boundary(elapsed))
+
+    def advance(self, now):
+        elapsed = max(now - self.start_time, self.due)
+        if elapsed >= self.total_time - EPSILON:
+            self.state = FINISHED
+            self.wakeup = None
+            self.emit(CookingEvent(FINISHED, self, now, 1.0, 0, module_states=(MODULE_DONE,) * len(self.slots)))
+            return
+
+        self.state = PROGRESS
+        self.due = self.next_transition(elapsed)
+        self.wakeup = self.start_time + self.due
+        active = [self.modules[slot.index] for slot in self.active_slots(elapsed)]
+        self.emit(CookingEvent(
+            PROGRESS,
+            self,
+            now,
+            elapsed / self.total_time,
+            self.remaining(elapsed),
+            active[0] if active else None,
+            active,
+            self.module_states(elapsed),
+            self.timeline.module_progress(elapsed)
+        ))
+
+    def emit(self, event):
+        if self.listener is not None:
+            self.listener(event)
+        for observer in self.observers:
+            observer(event)
+
+class CookingEngine:
+    def __init__(self, clock=None, resolution=0.001):
+        self.clock = clock or MonotonicClock()
+        self.resolution = resolution
+        self.sessions = {}
+        self.observers = []
+        self.on_schedule = None
+        self.wakeups = 0
+        self._queue = []
+        self._running = False
+        self._ids = itertools.count(1)
+
+    def start(self, recipe_name, recipe, listener=None, connect_delay=1.0, elapsed=0.0):
+        now = self.clock.now()
+        session = CookingSession(next(self._ids), recipe_name, recipe, listener, now, connect_delay, self.observers, elapsed)
+        self.sessions[session.session_id] = session
+        session.emit(CookingEvent(CONNECTING, session, now, elapsed / session.total_time, session.remaining(elapsed)))
+        self.push(session)
+        return session
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        self.observers.remove(observer)
+
+    def stop(self, session):
+        if self.sessions.pop(session.session_id, None) is None:
+            return
+        session.state = STOPPED
+        session.wakeup = None
+        session.emit(CookingEvent(STOPPED, session, self.clock.now()))
+        self.notify()
+
+    def push(self, session):
+        heapq.heappush(self._queue, (session.wakeup, session.session_id))
+        if not self._running:
+            self.notify()
+
+    def notify(self):
+        if self.on_schedule is not None:
+            self.on_schedule()
+
+    def next_deadline(self):
+        while self._queue:
+            when, session_id = self._queue[0]
+            session = self.sessions.get(session_id)
+            if session is not None and session.wakeup == when:
+                return when
+            heapq.heappop(self._queue)
+        return None
+
+    def run_due(self):
+        now = self.clock.now()
+        self._running = True
+        try:
+            while True:
+                when = self.next_deadline()
+                if when is None or when > now + self.resolution:
+                    break
+                _, session_id = heapq.heappop(self._queue)
+                session = self.sessions[session_id]
+                self.wakeups += 1
+                session.advance(max(now, when))
+                if session.wakeup is None:
+                    self.sessions.pop(session_id, None)
+                else:
+                    self.push(session)
+        finally:
+            self._running = False
+        return self.next_deadline()
+
+    def run_until(self, deadline=None):
+        while True:
+            when = self.next_deadline()
+            if when is None or (deadline is not None and when > deadline):
+                break
+            self.clock.advance_to(when)
+            self.run_due()
+        if deadline is not None:
+            self.clock.advance_to(deadline)
+
+    def run_until_idle(self):
+        self.run_until()
+
+def simulate(recipes, sessions, stagger=0.0, connect_delay=1.0):
+    clock = SimulatedClock()
+    engine = CookingEngine(clock)
+    counts = {CONNECTING: 0, PROGRESS: 0, FINISHED: 0, STOPPED: 0}
+
+    def count(event):
+        counts[event.kind] += 1
+
+    recipes = list(recipes)
+    started = time.perf_counter()
+    for i in range(sessions):
+        recipe_name, recipe = recipes[i % len(recipes)]
+        engine.run_until(i * stagger)
+        engine.start(recipe_name, recipe, count, connect_delay)
+    engine.run_until_idle()
+
+    return {
+        "sessions": sessions,
+        "events": counts,
+        "wakeups": engine.wakeups,
+        "simulated_seconds": clock.now(),
+        "wall_seconds": time.perf_counter() - started
+    }
+
+def main():
+    import argparse
+    import json
+    from recipe_store import RecipeStore
+
+    parser = argparse.ArgumentParser(description="Replay cook sessions against a simulated clock.")
+    parser.add_argument("--catalog", default="recipes")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--stagger", type=float, default=0.0)
+    args = parser.parse_args()
+
+    store = RecipeStore(args.catalog)
+    recipes = [(name, store.get(name)) for name in store.names()]
+    print(json.dumps(simulate(recipes, args.sessions, args.stagger), indent=2))
+
+if __name__ == "__main__":
+    main()
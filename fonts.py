@@ -0,0 +1,85 @@
+import os
+
+import customtkinter as ctk
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+EMOJI_FONT_PATHS = (
+    "/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/noto/NotoColorEmoji.ttf",
+    "/usr/share/fonts/google-noto-emoji/NotoColorEmoji.ttf",
+    "/System/Library/Fonts/Apple Color Emoji.ttc",
+    "C:/Windows/Fonts/seguiemj.ttf"
+)
+EMOJI_STRIKE_SIZES = (109, 160, 96, 64)
+
+class FontRegistry:
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, family, size, weight="normal"):
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(family=family, size=size, weight=weight)
+            self._fonts[key] = font
+        return font
+
+class GlyphCache:
+    def __init__(self, font_path=None):
+        self._images = {}
+        self._font_path = font_path
+        self._font = None
+        self._loaded = False
+
+    @property
+    def font(self):
+        if not self._loaded:
+            self._loaded = True
+            if Image is not None:
+                candidates = [self._font_path or os.environ.get("CHEFX_EMOJI_FONT")]
+                candidates.extend(EMOJI_FONT_PATHS)
+                for path in candidates:
+                    if path and os.path.exists(path):
+                        self._font = self.load_font(path)
+                        if self._font is not None:
+                            break
+        return self._font
+
+    @staticmethod
+    def load_font(path):
+        for size in EMOJI_STRIKE_SIZES:
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+        return None
+
+    def get(self, text, size):
+        if self.font is None:
+            return None
+
+        key = (text, size)
+        image = self._images.get(key)
+        if image is None:
+            image = ctk.CTkImage(self.render(text), size=(size, size))
+            self._images[key] = image
+        return image
+
+    def render(self, text):
+        left, top, right, bottom = self.font.getbbox(text)
+        width = max(1, right - left)
+        height = max(1, bottom - top)
+        side = max(width, height)
+
+        glyph = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+        ImageDraw.Draw(glyph).text(
+            ((side - width) // 2 - left, (side - height) // 2 - top),
+            text,
+            font=self._font,
+            embedded_color=True
+        )
+        return glyph
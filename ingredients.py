@@ -0,0 +1,117 @@
+import re
+from fractions import Fraction
+
+UNITS = {
+    "ml": ("ml", "ml", 1.0),
+    "milliliter": ("ml", "ml", 1.0),
+    "l": ("l", "ml", 1000.0),
+    "liter": ("l", "ml", 1000.0),
+    "litre": ("l", "ml", 1000.0),
+    "cup": ("cup", "ml", 240.0),
+    "tbsp": ("tbsp", "ml", 15.0),
+    "tablespoon": ("tbsp", "ml", 15.0),
+    "tsp": ("tsp", "ml", 5.0),
+    "teaspoon": ("tsp", "ml", 5.0),
+    "g": ("g", "g", 1.0),
+    "gram": ("g", "g", 1.0),
+    "kg": ("kg", "g", 1000.0),
+    "kilogram": ("kg", "g", 1000.0),
+    "clove": ("clove", "clove", 1.0),
+    "bunch": ("bunch", "bunch", 1.0),
+    "pinch": ("pinch", "pinch", 1.0)
+}
+SIZE_WORDS = {"small", "medium", "large", "ripe", "fresh"}
+IRREGULAR = {"leaves": "leaf", "chilies": "chili", "chillies": "chilli"}
+
+QUANTITY_PATTERN = re.compile(r"\s*(\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?)\s*")
+WORD_PATTERN = re.compile(r"[a-z]+")
+
+class Ingredient:
+    def __init__(self, amount, unit, item, note, text):
+        self.amount = amount
+        self.unit = unit
+        self.item = item
+        self.note = note
+        self.text = text
+
+    @property
+    def tracked(self):
+        return self.amount is not None
+
+    @property
+    def base_unit(self):
+        return UNITS[self.unit][1] if self.unit else "count"
+
+    @property
+    def base_amount(self):
+        if self.amount is None:
+            return None
+        return self.amount * UNITS[self.unit][2] if self.unit else self.amount
+
+    def to_list(self):
+        return [self.amount, self.unit, self.item, self.note, self.text]
+
+    @classmethod
+    def from_list(cls, values):
+        return cls(*values)
+
+def parse_quantity(text):
+    whole, _, fraction = text.strip().rpartition(" ")
+    return float(Fraction(fraction) + (int(whole) if whole else 0))
+
+def singular(word):
+    if word in IRREGULAR:
+        return IRREGULAR[word]
+    if word.endswith("oes") or word.endswith("ches"):
+        return word[:-2]
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+def parse_unit(word):
+    word = word.casefold()
+    if word in UNITS:
+        return UNITS[word][0]
+    word = singular(word)
+    if word in UNITS:
+        return UNITS[word][0]
+    return None
+
+def parse_ingredient(text):
+    match = QUANTITY_PATTERN.match(text)
+    if match is None:
+        item, note = normalize_item(text)
+        return Ingredient(None, None, item, note, text)
+
+    amount = parse_quantity(match.group(1))
+    rest = text[match.end():]
+    unit = None
+    word = WORD_PATTERN.match(rest.casefold())
+    if word is not None:
+        unit = parse_unit(word.group())
+        if unit is not None:
+            rest = rest[word.end():]
+    item, note = normalize_item(rest)
+    return Ingredient(amount, unit, item, note, text)
+
+def normalize_item(text):
+    note = ""
+    cut = len(text)
+    for separator in (",", "("):
+        position = text.find(separator)
+        if position != -1 and position < cut:
+            cut = position
+    if cut < len(text):
+        note = text[cut:].strip(" ,()")
+
+    words = WORD_PATTERN.findall(text[:cut].casefold().replace("-", " "))
+    while len(words) > 1 and words[0] in SIZE_WORDS:
+        words.pop(0)
+    if words:
+        words[-1] = singular(words[-1])
+    return " ".join(words), note
+
+def parse_ingredients(recipe):
+    return tuple(parse_ingredient(text) for text in recipe.ingredients)
@@ -0,0 +1,143 @@
+import json
+import os
+
+from ingredients import parse_ingredient
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Inventory:
+    def __init__(self, store, stock=()):
+        self.store = store
+        self.rows = {}
+        self.columns = {}
+        self.unused = []
+        requirements = []
+        for name in store.names():
+            row = {}
+            for ingredient in store.ingredients(name):
+                if not ingredient.tracked:
+                    continue
+                column = self.columns.setdefault((ingredient.item, ingredient.base_unit), len(self.columns))
+                row[column] = row.get(column, 0.0) + ingredient.base_amount
+            self.rows[name] = len(requirements)
+            requirements.append(row)
+        self.labels = list(self.columns)
+
+        if np is not None:
+            self.matrix = np.zeros((len(requirements), len(self.columns)))
+            for index, row in enumerate(requirements):
+                self.matrix[index, list(row)] = list(row.values())
+            self.stock = np.full(len(self.columns), np.inf)
+        else:
+            self.matrix = requirements
+            self.stock = [float("inf")] * len(self.columns)
+
+        for line in stock:
+            self.set_stock(line)
+
+    def set_stock(self, line):
+        ingredient = parse_ingredient(line)
+        column = self.columns.get((ingredient.item, ingredient.base_unit))
+        if column is None or not ingredient.tracked:
+            self.unused.append(line)
+            return
+        self.stock[column] = ingredient.base_amount
+
+    def scale(self, recipe_name, portions):
+        scaled = []
+        for ingredient in self.store.ingredients(recipe_name):
+            amount = ingredient.amount * portions if ingredient.tracked else None
+            scaled.append((amount, ingredient.unit, ingredient.item))
+        return scaled
+
+    def demand(self, orders):
+        if isinstance(orders, dict):
+            orders = orders.items()
+        orders = list(orders)
+        if np is not None:
+            counts = np.zeros(len(self.rows))
+            if orders:
+                names, portions = zip(*orders)
+                np.add.at(counts, [self.rows[name] for name in names], portions)
+            return counts @ self.matrix
+
+        totals = [0.0] * len(self.columns)
+        for name, portions in orders:
+            for column, amount in self.matrix[self.rows[name]].items():
+                totals[column] += amount * portions
+        return totals
+
+    def shortfall(self, orders):
+        demand = self.demand(orders)
+        if np is not None:
+            missing = demand - self.stock
+            return {self.labels[column]: float(missing[column]) for column in np.flatnonzero(missing > 1e-9)}
+        return {
+            self.labels[column]: demand[column] - self.stock[column]
+            for column in range(len(self.columns))
+            if demand[column] - self.stock[column] > 1e-9
+        }
+
+    def deduct(self, orders):
+        if isinstance(orders, dict):
+            orders = orders.items()
+        orders = list(orders)
+        missing = self.shortfall(orders)
+        if missing:
+            raise ValueError("out of stock: " + ", ".join(format_amount(amount, unit, item) for (item, unit), amount in missing.items()))
+        demand = self.demand(orders)
+        if np is not None:
+            self.stock -= demand
+        else:
+            self.stock = [stock - needed for stock, needed in zip(self.stock, demand)]
+
+    def stock_lines(self):
+        lines = [
+            format_amount(float(self.stock[column]), unit, item)
+            for column, (item, unit) in enumerate(self.labels)
+            if self.stock[column] != float("inf")
+        ]
+        lines.extend(self.unused)
+        return lines
+
+    @classmethod
+    def load(cls, store, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(store, json.load(f))
+
+    def save(self, path):
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.stock_lines(), f, ensure_ascii=False, indent=4)
+        os.replace(path + ".tmp", path)
+
+def format_amount(amount, unit, item):
+    if unit == "count":
+        return f"{amount:g} {item}"
+    return f"{amount:g} {unit} {item}"
+
+def main():
+    import argparse
+    from recipe_store import RecipeStore
+
+    parser = argparse.ArgumentParser(description="Check stock for a batch of orders.")
+    parser.add_argument("orders", help="JSON object mapping recipe names to portions")
+    parser.add_argument("--catalog", default="recipes")
+    parser.add_argument("--stock", required=True)
+    parser.add_argument("--deduct", action="store_true")
+    args = parser.parse_args()
+
+    inventory = Inventory.load(RecipeStore(args.catalog), args.stock)
+    with open(args.orders, encoding="utf-8") as f:
+        orders = json.load(f)
+
+    missing = inventory.shortfall(orders)
+    print(json.dumps({f"{item} ({unit})": amount for (item, unit), amount in missing.items()}, indent=2))
+    if args.deduct and not missing:
+        inventory.deduct(orders)
+        inventory.save(args.stock)
+
+if __name__ == "__main__":
+    main()
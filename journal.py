@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+import zlib
+
+import cooking_engine
+
+START = "start"
+PROGRESS = "progress"
+END = "end"
+
+def encode(record):
+    data = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return b"%08x %s\n" % (zlib.crc32(data), data)
+
+def decode(line):
+    checksum, _, data = line.rstrip(b"\n").partition(b" ")
+    if not line.endswith(b"\n") or int(checksum, 16) != zlib.crc32(data):
+        raise ValueError("torn or corrupt journal record")
+    return json.loads(data)
+
+def apply(sessions, record):
+    station = record["station"]
+    if record["op"] == START:
+        sessions[station] = {"station": station, "recipe": record["recipe"], "elapsed": record["elapsed"]}
+    elif record["op"] == PROGRESS:
+        if station in sessions:
+            sessions[station]["elapsed"] = record["elapsed"]
+    elif record["op"] == END:
+        sessions.pop(station, None)
+
+def replay(path):
+    sessions = {}
+    count = 0
+    valid = 0
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    record = decode(line)
+                except ValueError:
+                    break
+                apply(sessions, record)
+                count += 1
+                valid += len(line)
+    except FileNotFoundError:
+        pass
+    return sessions, count, valid
+
+class SessionJournal:
+    def __init__(self, path, sync_interval=1.0, compact_after=4096):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.compact_after = compact_after
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.sessions, self.records, valid = replay(path)
+        self.interrupted = [dict(session) for session in self.sessions.values()]
+        self._file = open(path, "ab")
+        if self._file.tell() != valid:
+            self._file.truncate(valid)
+        self._pending = []
+        self._urgent = False
+        self._closed = False
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._writer = threading.Thread(target=self.run, name="session-journal", daemon=True)
+        self._writer.start()
+
+    def append(self, record, urgent=False):
+        with self._lock:
+            apply(self.sessions, record)
+            self._pending.append(encode(record))
+            if urgent:
+                self._urgent = True
+                self._wake.notify()
+
+    def record(self, station, event):
+        session = event.session
+        if event.kind == cooking_engine.CONNECTING:
+            self.append({"op": START, "station": station, "recipe": session.recipe_name, "elapsed": session.due}, True)
+        elif event.kind == cooking_engine.PROGRESS:
+            self.append({"op": PROGRESS, "station": station, "elapsed": round(event.progress * session.total_time, 3)})
+        else:
+            self.append({"op": END, "station": station}, True)
+
+    def discard(self, station):
+        self.append({"op": END, "station": station}, True)
+
+    def run(self):
+        while True:
+            with self._lock:
+                if not self._urgent and not self._closed:
+                    self._wake.wait(self.sync_interval)
+                pending, self._pending = self._pending, []
+                self._urgent = False
+                closed = self._closed
+                snapshot = [dict(session) for session in self.sessions.values()]
+            if pending:
+                self._file.write(b"".join(pending))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self.records += len(pending)
+                if self.records >= self.compact_after:
+                    self.compact(snapshot)
+            if closed:
+                return
+
+    def compact(self, sessions):
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as f:
+            for session in sessions:
+                f.write(encode({"op": START, **session}))
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(temporary, self.path)
+        if hasattr(os, "O_DIRECTORY"):
+            directory = os.open(os.path.dirname(os.path.abspath(self.path)), os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+        self._file = open(self.path, "ab")
+        self.records = len(sessions)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        self._writer.join()
+        self._file.close()
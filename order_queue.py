@@ -0,0 +1,92 @@
+import itertools
+from collections import OrderedDict, deque
+
+class Order:
+    def __init__(self, order_id, recipe_name, recipe, duration, placed_at):
+        self.order_id = order_id
+        self.recipe_name = recipe_name
+        self.recipe = recipe
+        self.duration = duration
+        self.placed_at = placed_at
+
+class OrderQueue:
+    def __init__(self, clock, changeover_time=10.0, latency_target=600.0):
+        self.clock = clock
+        self.changeover_time = changeover_time
+        self.latency_target = latency_target
+        self.batches = OrderedDict()
+        self._ids = itertools.count(1)
+        self._depth = 0
+
+    def __len__(self):
+        return self._depth
+
+    def submit(self, recipe_name, recipe, duration):
+        order = Order(next(self._ids), recipe_name, recipe, duration, self.clock.now())
+        self.batches.setdefault(recipe_name, deque()).append(order)
+        self._depth += 1
+        return order
+
+    def requeue(self, order):
+        self.batches.setdefault(order.recipe_name, deque()).appendleft(order)
+        self.batches.move_to_end(order.recipe_name, last=False)
+        self._depth += 1
+
+    def cancel(self, order):
+        batch = self.batches.get(order.recipe_name)
+        if batch is None or order not in batch:
+            return False
+        batch.remove(order)
+        if not batch:
+            del self.batches[order.recipe_name]
+        self._depth -= 1
+        return True
+
+    def changeover(self, last_recipe, recipe_name):
+        if last_recipe is None or last_recipe == recipe_name:
+            return 0.0
+        return self.changeover_time
+
+    def choose(self, batches, last_recipe, now):
+        oldest = None
+        best = None
+        best_cost = None
+        for recipe_name, batch in batches.items():
+            head = batch[0]
+            if oldest is None or head.placed_at < oldest.placed_at:
+                oldest = head
+            cost = head.duration + self.changeover(last_recipe, recipe_name)
+            if best is None or (cost, head.placed_at) < (best_cost, best.placed_at):
+                best, best_cost = head, cost
+        if oldest is not None and now - oldest.placed_at >= self.latency_target:
+            return oldest
+        return best
+
+    def next_order(self, last_recipe=None):
+        order = self.choose(self.batches, last_recipe, self.clock.now())
+        if order is not None:
+            batch = self.batches[order.recipe_name]
+            batch.popleft()
+            if not batch:
+                del self.batches[order.recipe_name]
+            self._depth -= 1
+        return order
+
+    def estimate(self, stations):
+        now = self.clock.now()
+        batches = OrderedDict((name, deque(batch)) for name, batch in self.batches.items())
+        free = sorted(stations, key=lambda station: station[0])
+        starts = {}
+        while batches:
+            free_at, last_recipe = free.pop(0)
+            order = self.choose(batches, last_recipe, max(now, free_at))
+            batch = batches[order.recipe_name]
+            batch.popleft()
+            if not batch:
+                del batches[order.recipe_name]
+
+            start = max(now, free_at) + self.changeover(last_recipe, order.recipe_name)
+            starts[order.order_id] = start - now
+            free.append((start + order.duration, order.recipe_name))
+            free.sort(key=lambda station: station[0])
+        return starts
@@ -0,0 +1,171 @@
+import functools
+import gc
+import json
+import sys
+import threading
+import time
+import tkinter
+import traceback
+from bisect import bisect_left
+from collections import deque
+
+BUCKET_EDGES = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+TIMED_AFTER = "_profiled_after"
+
+def callback_name(func):
+    while isinstance(func, functools.partial):
+        func = func.func
+    return getattr(func, "__qualname__", None) or repr(func)
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_EDGES) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect_left(BUCKET_EDGES, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, fraction):
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(BUCKET_EDGES[index], self.max) if index < len(BUCKET_EDGES) else self.max
+        return 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max,
+            "buckets": {f"<={edge}": count for edge, count in zip(BUCKET_EDGES, self.counts) if count},
+            "overflow": self.counts[-1]
+        }
+
+class MainLoopProfiler:
+    def __init__(self, stall_threshold=0.1, max_stalls=100, clock=time.perf_counter):
+        self.stall_threshold = stall_threshold
+        self.clock = clock
+        self.started = clock()
+        self.histograms = {}
+        self.stalls = deque(maxlen=max_stalls)
+        self._current = None
+        self._reported = None
+        self._gc_started = None
+        self._after = None
+        self._call = None
+        self._watchdog = None
+        self._stopped = threading.Event()
+
+    def install(self):
+        self._after = tkinter.Misc.after
+        self._call = tkinter.CallWrapper.__call__
+        profiler = self
+
+        def after(widget, ms, func=None, *args):
+            if func is None:
+                return profiler._after(widget, ms)
+            due = profiler.clock() + (0 if ms == "idle" else ms / 1000)
+
+            def timed(*args):
+                return profiler.measure(callback_name(func), func, args, due)
+
+            timed.__name__ = TIMED_AFTER
+            return profiler._after(widget, ms, timed, *args)
+
+        def call(wrapper, *args):
+            if getattr(wrapper.func, "__name__", None) == TIMED_AFTER:
+                return profiler._call(wrapper, *args)
+            return profiler.measure(callback_name(wrapper.func), profiler._call, (wrapper,) + args)
+
+        tkinter.Misc.after = after
+        tkinter.CallWrapper.__call__ = call
+        gc.callbacks.append(self.on_gc)
+        self._watchdog = threading.Thread(target=self.watch, name="stall-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def uninstall(self):
+        if self._after is None:
+            return
+        tkinter.Misc.after = self._after
+        tkinter.CallWrapper.__call__ = self._call
+        gc.callbacks.remove(self.on_gc)
+        self._stopped.set()
+        self._watchdog.join()
+        self._after = None
+
+    def record(self, name, ms):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(ms)
+
+    def measure(self, name, func, args, due=None):
+        start = self.clock()
+        if due is not None:
+            self.record("after lag", max(0.0, start - due) * 1000)
+        outer = self._current is None
+        if outer:
+            self._current = (name, start)
+        try:
+            return func(*args)
+        finally:
+            elapsed = self.clock() - start
+            self.record(name, elapsed * 1000)
+            if outer:
+                if self._reported is self._current:
+                    self.stalls[-1]["duration_ms"] = elapsed * 1000
+                self._current = None
+
+    def on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_started = self.clock()
+        elif self._gc_started is not None:
+            self.record(f"gc gen{info['generation']}", (self.clock() - self._gc_started) * 1000)
+            self._gc_started = None
+
+    def watch(self):
+        main = threading.main_thread().ident
+        while not self._stopped.wait(self.stall_threshold / 4):
+            current = self._current
+            if current is None or current is self._reported:
+                continue
+            name, start = current
+            if self.clock() - start < self.stall_threshold:
+                continue
+            frame = sys._current_frames().get(main)
+            self.stalls.append({
+                "callback": name,
+                "at_s": start - self.started,
+                "duration_ms": None,
+                "stack": traceback.format_stack(frame) if frame is not None else []
+            })
+            self._reported = current
+
+    def to_dict(self):
+        return {
+            "uptime_s": self.clock() - self.started,
+            "stall_threshold_ms": self.stall_threshold * 1000,
+            "histograms": {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())},
+            "stalls": list(self.stalls)
+        }
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self, limit=10):
+        slowest = sorted(self.histograms.items(), key=lambda item: item[1].max, reverse=True)[:limit]
+        lines = [f"{len(self.stalls)} stalls over {self.stall_threshold * 1000:.0f} ms"]
+        for name, histogram in slowest:
+            lines.append(f"{histogram.max:9.1f} ms max {histogram.percentile(0.99):8.1f} ms p99 {histogram.count:7d}x  {name}")
+        return "\n".join(lines)
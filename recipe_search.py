@@ -0,0 +1,62 @@
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.casefold())
+
+def recipe_tokens(recipe):
+    texts = [recipe.name, recipe.description]
+    texts.extend(recipe.ingredients)
+    for module in recipe.modules:
+        texts.append(module.name)
+        texts.append(module.action)
+
+    tokens = set()
+    for text in texts:
+        tokens.update(tokenize(text))
+    return tokens
+
+class SearchIndex:
+    def __init__(self, names, postings, cache_size=64):
+        self.names = list(names)
+        self.postings = postings
+        self.tokens = sorted(postings)
+        self.cache_size = cache_size
+        self._prefix_cache = OrderedDict()
+
+    def match_prefix(self, prefix):
+        matches = self._prefix_cache.get(prefix)
+        if matches is not None:
+            self._prefix_cache.move_to_end(prefix)
+            return matches
+
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\U0010ffff", start)
+        if end - start == 1:
+            matches = frozenset(self.postings[self.tokens[start]])
+        else:
+            matches = set()
+            for token in self.tokens[start:end]:
+                matches.update(self.postings[token])
+            matches = frozenset(matches)
+
+        self._prefix_cache[prefix] = matches
+        if len(self._prefix_cache) > self.cache_size:
+            self._prefix_cache.popitem(last=False)
+        return matches
+
+    def search(self, query):
+        terms = tokenize(query)
+        if not terms:
+            return list(self.names)
+
+        result = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            matches = self.match_prefix(term)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        return [self.names[position] for position in sorted(result)]
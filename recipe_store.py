@@ -0,0 +1,238 @@
+import json
+import os
+import sys
+from collections import OrderedDict
+
+INDEX_FILE = "index.json"
+INGREDIENTS_FILE = "ingredients.json"
+INDEX_VERSION = 6
+
+class Record:
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+class Module(Record):
+    __slots__ = ("name", "action", "emoji", "duration", "after")
+
+    def __init__(self, name, action, emoji, duration=None, after=None):
+        init = object.__setattr__
+        init(self, "name", sys.intern(name))
+        init(self, "action", sys.intern(action))
+        init(self, "emoji", sys.intern(emoji))
+        init(self, "duration", None if duration is None else float(duration))
+        init(self, "after", None if after is None else tuple(sys.intern(name) for name in after))
+
+class Recipe(Record):
+    __slots__ = ("name", "icon", "color", "time", "description", "ingredients", "modules")
+
+    def __init__(self, name, icon, color, time, description, ingredients, modules):
+        init = object.__setattr__
+        init(self, "name", sys.intern(name))
+        init(self, "icon", sys.intern(icon))
+        init(self, "color", sys.intern(color))
+        init(self, "time", time)
+        init(self, "description", description)
+        init(self, "ingredients", tuple(ingredients))
+        init(self, "modules", tuple(modules))
+
+def field(data, key, kinds, where, optional=False):
+    if key not in data:
+        if optional:
+            return None
+        raise ValueError(f"{where}: missing {key}")
+    value = data[key]
+    if isinstance(value, bool) or not isinstance(value, kinds):
+        raise ValueError(f"{where}: {key} has the wrong type")
+    return value
+
+def positive(value, key, where):
+    if value is not None and value <= 0:
+        raise ValueError(f"{where}: {key} must be positive")
+    return value
+
+def string_list(data, key, where, optional=False):
+    values = field(data, key, list, where, optional)
+    if values is not None and not all(isinstance(value, str) for value in values):
+        raise ValueError(f"{where}: {key} must be a list of strings")
+    return values
+
+def compile_module(data, where):
+    if not isinstance(data, dict):
+        raise ValueError(f"{where}: expected an object")
+    return Module(
+        field(data, "name", str, where),
+        field(data, "action", str, where),
+        field(data, "emoji", str, where),
+        positive(field(data, "duration", (int, float), where, True), "duration", where),
+        string_list(data, "after", where, True)
+    )
+
+def compile_recipe(data, source="recipe"):
+    from cooking_engine import plan_modules
+
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: expected an object")
+    modules = field(data, "modules", list, source)
+    if not modules:
+        raise ValueError(f"{source}: modules must not be empty")
+
+    recipe = Recipe(
+        field(data, "name", str, source),
+        field(data, "icon", str, source),
+        field(data, "color", str, source),
+        positive(field(data, "time", (int, float), source), "time", source),
+        field(data, "description", str, source),
+        string_list(data, "ingredients", source),
+        [compile_module(module, f"{source}: module {index + 1}") for index, module in enumerate(modules)]
+    )
+    try:
+        plan_modules(recipe)
+    except ValueError as error:
+        raise ValueError(f"{source}: {error}") from None
+    return recipe
+
+class RecipeStore:
+    def __init__(self, path, cache_size=32):
+        self.path = path
+        self.cache_size = cache_size
+        self.index = OrderedDict()
+        self.files = {}
+        self._postings = {}
+        self._search = None
+        self._ingredients = None
+        self._cache = OrderedDict()
+        self.load_index()
+
+    def recipe_files(self):
+        files = {}
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith(".json") and entry.name not in (INDEX_FILE, INGREDIENTS_FILE):
+                files[entry.name] = entry.stat().st_mtime
+        return files
+
+    def read_cache(self, filename, files):
+        try:
+            with open(os.path.join(self.path, filename), encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("version") != INDEX_VERSION or cached.get("files") != files:
+            return None
+        return cached
+
+    def write_cache(self, filename, data):
+        path = os.path.join(self.path, filename)
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def load_index(self):
+        self.files = self.recipe_files()
+        cached = self.read_cache(INDEX_FILE, self.files) or self.rebuild_index(self.files)
+        self.index = OrderedDict((summary["name"], summary) for summary in cached["recipes"])
+        self._postings = cached["search"]
+        self._search = None
+        self._ingredients = None
+        self._cache.clear()
+
+    def rebuild_index(self, files):
+        from cooking_engine import planned_minutes
+        from ingredients import parse_ingredients
+        from recipe_search import recipe_tokens
+
+        recipes = []
+        postings = {}
+        ingredients = {}
+        for position, filename in enumerate(sorted(files)):
+            recipe = self.read_file(filename)
+            if recipe.name in ingredients:
+                raise ValueError(f"{filename}: duplicate recipe name {recipe.name}")
+            for token in recipe_tokens(recipe):
+                postings.setdefault(token, []).append(position)
+            recipes.append({
+                "name": recipe.name,
+                "file": filename,
+                "icon": recipe.icon,
+                "color": recipe.color,
+                "time": planned_minutes(recipe),
+                "description": recipe.description,
+                "ingredient_count": len(recipe.ingredients)
+            })
+            ingredients[recipe.name] = [ingredient.to_list() for ingredient in parse_ingredients(recipe)]
+
+        index = {"version": INDEX_VERSION, "files": files, "recipes": recipes, "search": postings}
+        self.write_cache(INDEX_FILE, index)
+        self.write_cache(INGREDIENTS_FILE, {"version": INDEX_VERSION, "files": files, "ingredients": ingredients})
+        return index
+
+    def rebuild_ingredients(self):
+        from ingredients import parse_ingredients
+
+        ingredients = {
+            name: [ingredient.to_list() for ingredient in parse_ingredients(self.read_file(summary["file"]))]
+            for name, summary in self.index.items()
+        }
+        cached = {"version": INDEX_VERSION, "files": self.files, "ingredients": ingredients}
+        self.write_cache(INGREDIENTS_FILE, cached)
+        return cached
+
+    def read_file(self, filename):
+        try:
+            with open(os.path.join(self.path, filename), encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError as error:
+            raise ValueError(f"{filename}: {error}") from None
+        return compile_recipe(data, filename)
+
+    @property
+    def search(self):
+        if self._search is None:
+            from recipe_search import SearchIndex
+            self._search = SearchIndex(self.index, self._postings)
+            self._postings = None
+        return self._search
+
+    def names(self):
+        return list(self.index)
+
+    def summary(self, name):
+        return self.index[name]
+
+    def ingredients(self, name):
+        if self._ingredients is None:
+            cached = self.read_cache(INGREDIENTS_FILE, self.files) or self.rebuild_ingredients()
+            self._ingredients = cached["ingredients"]
+        parsed = self._ingredients[name]
+        if isinstance(parsed, list):
+            from ingredients import Ingredient
+            parsed = self._ingredients[name] = tuple(Ingredient.from_list(values) for values in parsed)
+        return parsed
+
+    def get(self, name):
+        recipe = self._cache.get(name)
+        if recipe is not None:
+            self._cache.move_to_end(name)
+            return recipe
+
+        recipe = self.read_file(self.index[name]["file"])
+        self._cache[name] = recipe
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return recipe
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.index)
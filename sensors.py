@@ -0,0 +1,190 @@
+import math
+import random
+import threading
+import time
+from array import array
+
+CHANNELS = ("temperature", "motor_rpm")
+MODULE_SETPOINTS = {
+    "Cooktop": {"temperature": 90.0},
+    "Motor": {"motor_rpm": 120.0}
+}
+
+class SimulatedSource:
+    channels = CHANNELS
+
+    def __init__(self, active_modules=lambda: (), ambient=25.0, heat_rate=0.08, spin_rate=2.0, noise=0.3, seed=None):
+        self.active_modules = active_modules
+        self.ambient = ambient
+        self.heat_rate = heat_rate
+        self.spin_rate = spin_rate
+        self.noise = noise
+        self.random = random.Random(seed)
+        self.temperature = ambient
+        self.motor_rpm = 0.0
+
+    def read(self, dt):
+        targets = {"temperature": self.ambient, "motor_rpm": 0.0}
+        for name in self.active_modules():
+            targets.update(MODULE_SETPOINTS.get(name, {}))
+        self.temperature += (targets["temperature"] - self.temperature) * (1 - math.exp(-self.heat_rate * dt))
+        self.motor_rpm += (targets["motor_rpm"] - self.motor_rpm) * (1 - math.exp(-self.spin_rate * dt))
+        return (
+            self.temperature + self.random.gauss(0.0, self.noise),
+            max(0.0, self.motor_rpm + self.random.gauss(0.0, self.noise * 2))
+        )
+
+class RollingStats:
+    def __init__(self, window):
+        self.window = window
+        self.values = array("d", bytes(8 * window))
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+
+    def add(self, value):
+        old = self.values[self.index]
+        if self.count == self.window:
+            self.total -= old
+            self.squares -= old * old
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.window
+        self.total += value
+        self.squares += value * value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stdev(self):
+        if self.count < 2:
+            return 0.0
+        mean = self.mean
+        return math.sqrt(max(0.0, self.squares / self.count - mean * mean))
+
+class SensorPipeline:
+    def __init__(self, source, publish, rate=200, display_rate=4, points_per_second=8, window=1.0, capacity=None):
+        self.source = source
+        self.publish = publish
+        self.rate = rate
+        self.channels = source.channels
+        self.capacity = capacity or rate * 60
+        self.times = array("d", bytes(8 * self.capacity))
+        self.samples = [array("d", bytes(8 * self.capacity)) for _ in self.channels]
+        self.count = 0
+        self.stats = [RollingStats(max(1, int(rate * window))) for _ in self.channels]
+        self.listeners = []
+
+        self.bucket_size = max(1, rate // points_per_second)
+        self.publish_every = max(1, rate // display_rate)
+        self._bucket = [[math.inf, -math.inf, 0.0] for _ in self.channels]
+        self._bucket_count = 0
+        self._points = []
+        self._since_publish = 0
+        self.started = None
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def sample(self, now, period):
+        if self.started is None:
+            self.started = now
+        self.ingest(now - self.started, self.source.read(period))
+
+    def ingest(self, when, values):
+        index = self.count % self.capacity
+        self.times[index] = when
+        bucket = self._bucket
+        for channel, value in enumerate(values):
+            self.samples[channel][index] = value
+            self.stats[channel].add(value)
+            entry = bucket[channel]
+            if value < entry[0]:
+                entry[0] = value
+            if value > entry[1]:
+                entry[1] = value
+            entry[2] += value
+        self.count += 1
+
+        for listener in self.listeners:
+            listener(when, values)
+
+        self._bucket_count += 1
+        if self._bucket_count == self.bucket_size:
+            self._points.append((when, tuple((low, high, total / self._bucket_count) for low, high, total in bucket)))
+            for entry in bucket:
+                entry[0], entry[1], entry[2] = math.inf, -math.inf, 0.0
+            self._bucket_count = 0
+
+        self._since_publish += 1
+        if self._since_publish == self.publish_every:
+            self._since_publish = 0
+            points, self._points = self._points, []
+            self.publish({
+                "time": when,
+                "points": points,
+                "mean": tuple(stats.mean for stats in self.stats),
+                "stdev": tuple(stats.stdev for stats in self.stats)
+            })
+
+    def recent(self, channel, count):
+        count = min(count, self.count, self.capacity)
+        end = self.count % self.capacity
+        values = self.samples[self.channels.index(channel)]
+        if count <= end:
+            return values[end - count:end]
+        return values[self.capacity - (count - end):] + values[:end]
+
+class SensorHub:
+    def __init__(self, rate=200):
+        self.rate = rate
+        self.pipelines = ()
+        self.overruns = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add(self, pipeline):
+        with self._lock:
+            self.pipelines += (pipeline,)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="sensor-hub", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def remove(self, pipeline):
+        with self._lock:
+            self.pipelines = tuple(entry for entry in self.pipelines if entry is not pipeline)
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def run(self):
+        period = 1 / self.rate
+        deadline = time.perf_counter()
+        while not self._stopped.is_set():
+            pipelines = self.pipelines
+            if not pipelines:
+                self._wake.wait()
+                self._wake.clear()
+                deadline = time.perf_counter()
+                continue
+            now = time.perf_counter()
+            for pipeline in pipelines:
+                pipeline.sample(now, period)
+            deadline += period
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                self._stopped.wait(delay)
+            elif delay < -period * self.rate / 4:
+                self.overruns += 1
+                deadline = time.perf_counter()
@@ -0,0 +1,206 @@
+import mmap
+import os
+import struct
+import time
+import zlib
+
+import cooking_engine
+
+MAGIC = b"CXTL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQQ")
+HEADER_SIZE = 64
+WRITE_INDEX_OFFSET = 12
+RECORD = struct.Struct("<dQIBBHff")
+
+SESSION_START = 1
+MODULE_START = 2
+MODULE_END = 3
+SAMPLE = 4
+SESSION_END = 5
+SESSION_STOP = 6
+
+def recipe_key(recipe_name):
+    return zlib.crc32(recipe_name.encode("utf-8"))
+
+class TelemetryBuffer:
+    def __init__(self, path, capacity=65536):
+        self.path = path
+        size = HEADER_SIZE + capacity * RECORD.size
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a+b")
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell() != size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+        magic, version, record_size, stored_capacity, write_index, run = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size or stored_capacity != capacity:
+            self._map[:] = bytes(size)
+            write_index, run = 0, 0
+
+        self.capacity = capacity
+        self.write_index = write_index
+        self.run = run + 1
+        HEADER.pack_into(self._map, 0, MAGIC, VERSION, RECORD.size, capacity, write_index, self.run)
+
+    def append(self, when, session, recipe, kind, module=0, progress=0.0, seconds=0.0):
+        offset = HEADER_SIZE + (self.write_index % self.capacity) * RECORD.size
+        RECORD.pack_into(self._map, offset, when, session, recipe, kind, module, 0, progress, seconds)
+        self.write_index += 1
+        struct.pack_into("<Q", self._map, WRITE_INDEX_OFFSET, self.write_index)
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+class TelemetryRecorder:
+    def __init__(self, path, capacity=65536, clock=time.time):
+        self.buffer = TelemetryBuffer(path, capacity)
+        self.clock = clock
+        self.sessions = {}
+
+    def on_event(self, event):
+        session = event.session
+        entry = self.sessions.get(session.session_id)
+        elapsed = event.time - session.start_time
+        now = self.clock()
+
+        if event.kind == cooking_engine.CONNECTING:
+            resumed = session.due / session.total_time
+            entry = [
+                (self.buffer.run << 32) | session.session_id,
+                recipe_key(session.recipe_name),
+                session.module_states(session.due) if resumed else (cooking_engine.MODULE_PENDING,) * len(session.modules)
+            ]
+            self.sessions[session.session_id] = entry
+            self.buffer.append(now, entry[0], entry[1], SESSION_START, 0, resumed, session.total_time)
+            return
+        if entry is None:
+            return
+
+        key, recipe, previous = entry
+        if event.module_states:
+            for index, state in enumerate(event.module_states):
+                if state == previous[index]:
+                    continue
+                if previous[index] == cooking_engine.MODULE_PENDING:
+                    self.buffer.append(now, key, recipe, MODULE_START, index, event.progress, elapsed)
+                if state == cooking_engine.MODULE_DONE:
+                    self.buffer.append(now, key, recipe, MODULE_END, index, event.progress, elapsed)
+            entry[2] = event.module_states
+
+        if event.kind == cooking_engine.PROGRESS:
+            self.buffer.append(now, key, recipe, SAMPLE, 0, event.progress, elapsed)
+        elif event.kind == cooking_engine.FINISHED:
+            self.buffer.append(now, key, recipe, SESSION_END, 0, 1.0, elapsed)
+            del self.sessions[session.session_id]
+            self.buffer.flush()
+        elif event.kind == cooking_engine.STOPPED:
+            self.buffer.append(now, key, recipe, SESSION_STOP, 0, event.progress, elapsed)
+            del self.sessions[session.session_id]
+            self.buffer.flush()
+
+    def close(self):
+        self.buffer.close()
+
+class TelemetryReader:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = f.read()
+        magic, version, record_size, self.capacity, self.write_index, self.run = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a telemetry buffer")
+
+    def records(self):
+        count = min(self.write_index, self.capacity)
+        first = self.write_index % self.capacity if self.write_index > self.capacity else 0
+        view = memoryview(self.data)[HEADER_SIZE:HEADER_SIZE + self.capacity * RECORD.size]
+        yield from RECORD.iter_unpack(view[first * RECORD.size:count * RECORD.size])
+        if first:
+            yield from RECORD.iter_unpack(view[:first * RECORD.size])
+
+    def summarize(self, recipe_names=()):
+        names = {recipe_key(name): name for name in recipe_names}
+        sessions = {}
+        for when, session, recipe, kind, module, _, progress, seconds in self.records():
+            if kind == SESSION_START:
+                sessions[session] = {"recipe": recipe, "planned": seconds, "resumed": progress > 0, "modules": {}, "starts": {}}
+                continue
+            entry = sessions.get(session)
+            if entry is None:
+                continue
+            if kind == MODULE_START:
+                entry["starts"][module] = seconds
+            elif kind == MODULE_END and module in entry["starts"]:
+                entry["modules"][module] = seconds - entry["starts"][module]
+            elif kind == SESSION_END:
+                entry["duration"] = seconds
+            elif kind == SESSION_STOP:
+                entry["stopped"] = seconds
+
+        summary = {}
+        for entry in sessions.values():
+            name = names.get(entry["recipe"], f"{entry['recipe']:08x}")
+            stats = summary.get(name)
+            if stats is None:
+                stats = summary[name] = {
+                    "sessions": 0,
+                    "completed": 0,
+                    "stopped": 0,
+                    "resumed": 0,
+                    "timed": 0,
+                    "duration_total": 0.0,
+                    "planned_total": 0.0,
+                    "module_totals": {},
+                    "module_counts": {}
+                }
+            stats["sessions"] += 1
+            if entry["resumed"]:
+                stats["resumed"] += 1
+            if "duration" in entry:
+                stats["completed"] += 1
+                if not entry["resumed"]:
+                    stats["timed"] += 1
+                    stats["duration_total"] += entry["duration"]
+                    stats["planned_total"] += entry["planned"]
+            elif "stopped" in entry:
+                stats["stopped"] += 1
+            for module, duration in entry["modules"].items():
+                stats["module_totals"][module] = stats["module_totals"].get(module, 0.0) + duration
+                stats["module_counts"][module] = stats["module_counts"].get(module, 0) + 1
+
+        for stats in summary.values():
+            timed = stats.pop("timed")
+            duration_total = stats.pop("duration_total")
+            planned_total = stats.pop("planned_total")
+            stats["mean_duration"] = duration_total / timed if timed else None
+            stats["mean_planned"] = planned_total / timed if timed else None
+            stats["mean_overrun"] = stats["mean_duration"] - stats["mean_planned"] if timed else None
+            totals = stats.pop("module_totals")
+            counts = stats.pop("module_counts")
+            stats["mean_module_durations"] = {module: totals[module] / counts[module] for module in sorted(totals)}
+        return summary
+
+def main():
+    import argparse
+    import json
+    from recipe_store import RecipeStore
+
+    parser = argparse.ArgumentParser(description="Summarise cook telemetry.")
+    parser.add_argument("path")
+    parser.add_argument("--catalog", default=None)
+    args = parser.parse_args()
+
+    names = RecipeStore(args.catalog).names() if args.catalog else ()
+    print(json.dumps(TelemetryReader(args.path).summarize(names), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import random
+import shutil
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+CATALOG_DIR = os.path.join(ROOT_DIR, "recipes")
+
+def recipe_data(modules, name="Test Soup", time=1, ingredients=()):
+    return {
+        "name": name,
+        "icon": "🍲",
+        "color": "#FF6B6B",
+        "time": time,
+        "description": "Test recipe",
+        "ingredients": list(ingredients),
+        "modules": [
+            dict(
+                {"name": module, "action": f"Running {module}", "emoji": "🔥"},
+                **({} if duration is None else {"duration": duration}),
+                **({} if after is None else {"after": list(after)})
+            )
+            for module, duration, after in modules
+        ]
+    }
+
+def reference_active(slots, elapsed):
+    return tuple(sorted((slot for slot in slots if slot.start <= elapsed < slot.end), key=lambda slot: slot.start))
+
+def reference_states(slots, elapsed):
+    from cooking_engine import MODULE_ACTIVE, MODULE_DONE, MODULE_PENDING
+
+    return tuple(
+        MODULE_DONE if slot.end <= elapsed
+        else MODULE_ACTIVE if slot.start <= elapsed
+        else MODULE_PENDING
+        for slot in slots
+    )
+
+def random_dag(make_recipe, count, seed):
+    generator = random.Random(seed)
+    modules = []
+    for index in range(count):
+        after = generator.sample([f"M{other}" for other in range(index)], min(index, generator.randint(0, 3)))
+        modules.append((f"M{index}", generator.randint(1, 20), after))
+    return make_recipe(modules)
+
+@pytest.fixture
+def make_recipe():
+    from recipe_store import compile_recipe
+
+    def make(modules, **fields):
+        return compile_recipe(recipe_data(modules, **fields))
+
+    return make
+
+@pytest.fixture
+def catalog(tmp_path):
+    from recipe_store import INDEX_FILE, INGREDIENTS_FILE
+
+    for filename in sorted(os.listdir(CATALOG_DIR)):
+        if filename.endswith(".json") and filename not in (INDEX_FILE, INGREDIENTS_FILE):
+            shutil.copy(os.path.join(CATALOG_DIR, filename), tmp_path)
+    return str(tmp_path)
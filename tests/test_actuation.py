@@ -0,0 +1,50 @@
+import pytest
+
+import cooking_engine
+from actuation import CHECKSUM, HEADER, HEADER_SIZE, MAGIC, RECORD_SIZE, SEQUENCE, ProcessEngine, StateBlock
+
+def make_block(slots=2):
+    block = StateBlock(bytearray(StateBlock.size(slots)), slots)
+    block.initialize()
+    return block
+
+def test_header_is_written():
+    block = make_block(3)
+    assert HEADER.unpack_from(block.buffer, 0)[0] == MAGIC
+    assert HEADER.unpack_from(block.buffer, 0)[2] == 3
+
+def test_write_then_read():
+    block = make_block()
+    block.write(1, 7, cooking_engine.PROGRESS, 12, 0.5, 12.0, 30.0)
+    block.write(1, 7, cooking_engine.FINISHED, 0, 1.0, 24.0, 0.0)
+    sequence, session_id, code, remaining, progress, elapsed, wakeup = block.read(1)
+    assert sequence % 2 == 0 and sequence == 4
+    assert (session_id, remaining, progress, elapsed, wakeup) == (7, 0, 1.0, 24.0, 0.0)
+    assert code == 3
+
+def test_unwritten_slot_reads_as_missing():
+    assert make_block().read(0) is None
+
+def test_write_in_progress_is_not_returned():
+    block = make_block()
+    block.write(0, 1, cooking_engine.PROGRESS, 5, 0.1, 1.0, 2.0)
+    SEQUENCE.pack_into(block.buffer, HEADER_SIZE, 3)
+    assert block.read(0, attempts=4) is None
+
+@pytest.mark.parametrize("position", [CHECKSUM.size, RECORD_SIZE - 1])
+def test_torn_payload_is_not_returned(position):
+    block = make_block()
+    block.write(0, 1, cooking_engine.PROGRESS, 5, 0.1, 1.0, 2.0)
+    block.buffer[HEADER_SIZE + position] ^= 0xFF
+    assert block.read(0, attempts=4) is None
+
+def test_start_fails_cleanly_when_controller_is_dead(make_recipe):
+    engine = ProcessEngine(1)
+    try:
+        engine.process.kill()
+        engine.process.join()
+        with pytest.raises(RuntimeError, match="not running"):
+            engine.start("Test Soup", make_recipe([("boil", 5, None)]))
+        assert not engine.sessions and engine._slots == [None]
+    finally:
+        engine.close()
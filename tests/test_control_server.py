@@ -0,0 +1,73 @@
+import http.client
+import json
+
+import pytest
+
+from control_server import ControlServer
+
+@pytest.fixture
+def server():
+    calls = []
+
+    def start(recipe_name):
+        if recipe_name == "Nope":
+            raise ValueError(f"unknown recipe {recipe_name}")
+        calls.append(("start", recipe_name))
+        return {"station": 1}
+
+    def stop(number):
+        calls.append(("stop", number))
+        return {"station": number}
+
+    server = ControlServer(
+        lambda callback: callback(),
+        {"recipes": lambda: [{"name": "Tur Dal"}], "start": start, "stop": stop},
+        port=0
+    )
+    server.start()
+    server.calls = calls
+    server.port = server.server.sockets[0].getsockname()[1]
+    yield server
+    server.stop()
+
+def request(server, method, path, body=None):
+    connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    connection.request(method, path, json.dumps(body) if body is not None else None)
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    connection.close()
+    return response.status, payload
+
+def test_routes_call_handlers(server):
+    assert request(server, "GET", "/recipes") == (200, [{"name": "Tur Dal"}])
+    assert request(server, "POST", "/orders", {"recipe": "Tur Dal"}) == (200, {"station": 1})
+    assert request(server, "POST", "/stations/2/stop/") == (200, {"station": 2})
+    assert server.calls == [("start", "Tur Dal"), ("stop", 2)]
+
+def test_stations_report_published_state(server):
+    server.publish(1, {"status": "IDLE"})
+    server.publish(1, {"progress": 40})
+    assert request(server, "GET", "/stations") == (200, [{"station": 1, "state": {"status": "IDLE", "progress": 40}}])
+
+@pytest.mark.parametrize("method, path, body, status", [
+    ("POST", "/orders", {"recipe": "Nope"}, 400),
+    ("POST", "/orders", {}, 400),
+    ("POST", "/stations/x/stop", None, 400),
+    ("DELETE", "/recipes", None, 405),
+    ("GET", "/nope", None, 404)
+])
+def test_bad_requests_are_rejected(server, method, path, body, status):
+    code, payload = request(server, method, path, body)
+    assert code == status and "error" in payload
+    assert server.calls == []
+
+def test_events_start_with_a_snapshot(server):
+    server.publish(3, {"status": "COOKING"})
+    request(server, "GET", "/stations")
+    connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    connection.request("GET", "/events")
+    response = connection.getresponse()
+    assert response.getheader("Content-Type") == "text/event-stream"
+    assert response.fp.readline() == b"event: station\n"
+    assert json.loads(response.fp.readline()[len(b"data: "):]) == {"station": 3, "state": {"status": "COOKING"}}
+    connection.close()
@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+import cooking_engine
+from conftest import random_dag, reference_active, reference_states
+from cooking_engine import CookingEngine, SimulatedClock, plan_modules, simulate
+from recipe_store import RecipeStore
+
+def run_session(recipe, connect_delay=1.0, elapsed=0.0):
+    engine = CookingEngine(SimulatedClock())
+    events = []
+    session = engine.start(recipe.name, recipe, events.append, connect_delay, elapsed)
+    engine.run_until_idle()
+    return engine, session, events
+
+@pytest.mark.parametrize("seed", range(3))
+def test_event_stream_matches_plan(make_recipe, seed):
+    recipe = random_dag(make_recipe, 12, seed)
+    _, session, events = run_session(recipe)
+    slots = plan_modules(recipe)
+
+    assert [event.kind for event in events[:1]] == [cooking_engine.CONNECTING]
+    assert events[-1].kind == cooking_engine.FINISHED
+    assert events[-1].module_states == (cooking_engine.MODULE_DONE,) * len(slots)
+    progress = [event for event in events if event.kind == cooking_engine.PROGRESS]
+    assert len(progress) + 2 == len(events)
+    for previous, event in zip(progress, progress[1:]):
+        assert event.progress > previous.progress
+        assert event.remaining <= previous.remaining
+    for event in progress:
+        elapsed = event.time - session.start_time
+        assert event.active == [recipe.modules[slot.index] for slot in reference_active(slots, elapsed)]
+        assert event.module_states == reference_states(slots, elapsed)
+        assert event.remaining == math.ceil(max(slot.end for slot in slots) - elapsed - cooking_engine.EPSILON)
+
+def test_every_remaining_second_is_reported(catalog):
+    recipe = RecipeStore(catalog).get("Tur Dal")
+    _, _, events = run_session(recipe)
+    remaining = [event.remaining for event in events if event.kind == cooking_engine.PROGRESS]
+    assert sorted(set(remaining), reverse=True) == list(range(24, 0, -1))
+
+def test_resume_starts_at_offset(catalog):
+    recipe = RecipeStore(catalog).get("Tur Dal")
+    _, session, events = run_session(recipe, elapsed=13.0)
+    assert events[0].kind == cooking_engine.CONNECTING
+    assert events[0].remaining == 11
+    first = events[1]
+    assert first.time - session.start_time == pytest.approx(13.0)
+    assert first.module_states == reference_states(plan_modules(recipe), 13.0)
+
+def test_stop_ends_session(catalog):
+    recipe = RecipeStore(catalog).get("Tur Dal")
+    clock = SimulatedClock()
+    engine = CookingEngine(clock)
+    events = []
+    session = engine.start(recipe.name, recipe, events.append)
+    engine.run_until(5.0)
+    engine.stop(session)
+    engine.stop(session)
+    engine.run_until_idle()
+    assert events[-1].kind == cooking_engine.STOPPED
+    assert [event.kind for event in events].count(cooking_engine.STOPPED) == 1
+    assert engine.next_deadline() is None
+    assert clock.now() == 5.0
+
+def test_simulate_replays_sessions(catalog):
+    store = RecipeStore(catalog)
+    recipes = [(name, store.get(name)) for name in store.names()]
+    result = simulate(recipes, 30, stagger=0.5)
+    per_recipe = {name: len(run_session(recipe)[2]) - 2 for name, recipe in recipes}
+    assert result["events"] == {
+        cooking_engine.CONNECTING: 30,
+        cooking_engine.PROGRESS: sum(per_recipe[recipes[i % len(recipes)][0]] for i in range(30)),
+        cooking_engine.FINISHED: 30,
+        cooking_engine.STOPPED: 0
+    }
+    assert result["simulated_seconds"] == pytest.approx(14.5 + 1.0 + 24.0)
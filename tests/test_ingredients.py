@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+
+from ingredients import Ingredient, parse_ingredient, parse_quantity, singular
+from recipe_store import INDEX_FILE, INGREDIENTS_FILE, RecipeStore
+
+@pytest.mark.parametrize("text, expected", [
+    ("1 1/2 cups water", [1.5, "cup", "water", ""]),
+    ("1/4 tsp black pepper", [0.25, "tsp", "black pepper", ""]),
+    ("400ml water", [400.0, "ml", "water", ""]),
+    ("3 cloves garlic, minced", [3.0, "clove", "garlic", "minced"]),
+    ("2 bunches fresh spinach leaves, washed and chopped", [2.0, "bunch", "spinach leaf", "washed and chopped"]),
+    ("2 medium tomatoes", [2.0, None, "tomato", ""]),
+    ("1/4 cup cream (optional)", [0.25, "cup", "cream", "optional"]),
+    ("salt to taste", [None, None, "salt to taste", ""])
+])
+def test_parse_ingredient(text, expected):
+    assert parse_ingredient(text).to_list() == expected + [text]
+
+@pytest.mark.parametrize("text, base_unit, base_amount", [
+    ("1 1/2 cups water", "ml", 360.0),
+    ("1 kg potatoes", "g", 1000.0),
+    ("2 medium tomatoes", "count", 2.0),
+    ("salt to taste", "count", None)
+])
+def test_base_units(text, base_unit, base_amount):
+    ingredient = parse_ingredient(text)
+    assert (ingredient.base_unit, ingredient.base_amount) == (base_unit, base_amount)
+    assert ingredient.tracked == (base_amount is not None)
+
+@pytest.mark.parametrize("text, value", [("2", 2.0), ("0.5", 0.5), ("3/4", 0.75), ("2 1/4", 2.25)])
+def test_parse_quantity(text, value):
+    assert parse_quantity(text) == value
+
+@pytest.mark.parametrize("word, expected", [
+    ("tomatoes", "tomato"), ("bunches", "bunch"), ("chilies", "chili"),
+    ("berries", "berry"), ("leaves", "leaf"), ("cloves", "clove"), ("glass", "glass")
+])
+def test_singular(word, expected):
+    assert singular(word) == expected
+
+def test_list_round_trip():
+    ingredient = parse_ingredient("3 cloves garlic, minced")
+    assert Ingredient.from_list(ingredient.to_list()).to_list() == ingredient.to_list()
+
+def test_ingredients_load_outside_the_index(catalog):
+    store = RecipeStore(catalog)
+    with open(os.path.join(catalog, INDEX_FILE), encoding="utf-8") as f:
+        assert "ingredients" not in json.load(f)
+    assert store._ingredients is None
+    os.remove(os.path.join(catalog, INGREDIENTS_FILE))
+    name = store.names()[0]
+    assert store.ingredients(name)
+    assert os.path.exists(os.path.join(catalog, INGREDIENTS_FILE))
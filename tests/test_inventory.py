@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+import inventory
+from conftest import recipe_data
+from inventory import Inventory
+from recipe_store import RecipeStore
+
+RECIPES = {
+    "Potato Soup": ["2 cups water", "1 kg potatoes", "salt to taste"],
+    "Onion Broth": ["500 ml water", "2 onions"]
+}
+
+@pytest.fixture(params=["numpy", "python"])
+def store(request, tmp_path, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(inventory, "np", None)
+    catalog = tmp_path / "catalog"
+    catalog.mkdir()
+    for index, (name, ingredients) in enumerate(RECIPES.items()):
+        data = recipe_data([("boil", 5, None)], name=name, ingredients=ingredients)
+        (catalog / f"recipe_{index}.json").write_text(json.dumps(data), encoding="utf-8")
+    return RecipeStore(str(catalog))
+
+def stock_of(stock):
+    return [float(amount) for amount in stock]
+
+def test_demand_sums_base_amounts(store):
+    stock = Inventory(store)
+    water, potato, onion = (stock.columns[key] for key in [("water", "ml"), ("potato", "g"), ("onion", "count")])
+    demand = stock_of(stock.demand({"Potato Soup": 2, "Onion Broth": 1}))
+    assert (demand[water], demand[potato], demand[onion]) == (1460.0, 2000.0, 2.0)
+    assert len(stock.columns) == 3
+
+def test_shortfall_lists_only_missing_items(store):
+    stock = Inventory(store, ["1 l water", "1500 g potatoes", "3 onions"])
+    assert stock.shortfall({"Onion Broth": 1}) == {}
+    assert stock.shortfall([("Potato Soup", 2), ("Onion Broth", 2)]) == {("water", "ml"): 960.0, ("potato", "g"): 500.0, ("onion", "count"): 1.0}
+
+def test_deduct_is_all_or_nothing(store):
+    stock = Inventory(store, ["1 l water", "1500 g potatoes", "3 onions"])
+    before = stock_of(stock.stock)
+    with pytest.raises(ValueError, match="out of stock: 500 g potato$"):
+        stock.deduct({"Potato Soup": 2})
+    assert stock_of(stock.stock) == before
+    stock.deduct({"Potato Soup": 1})
+    assert stock.stock_lines() == ["520 ml water", "500 g potato", "3 onion"]
+
+def test_stock_lines_round_trip(store, tmp_path):
+    path = str(tmp_path / "inventory.json")
+    stock = Inventory(store, ["2 onions", "1 pinch saffron"])
+    stock.deduct({"Onion Broth": 1})
+    stock.save(path)
+    assert Inventory.load(store, path).stock_lines() == ["0 onion", "1 pinch saffron"]
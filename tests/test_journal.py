@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+import cooking_engine
+from cooking_engine import CookingEngine, SimulatedClock
+from journal import END, PROGRESS, START, SessionJournal, decode, encode, replay
+from recipe_store import RecipeStore
+
+def write_records(path, records):
+    with open(path, "wb") as f:
+        for record in records:
+            f.write(encode(record))
+
+def test_records_round_trip():
+    record = {"op": START, "station": 2, "recipe": "Tur Dal", "elapsed": 1.5}
+    assert decode(encode(record)) == record
+
+@pytest.mark.parametrize("line", [
+    encode({"op": END, "station": 1})[:-1],
+    encode({"op": END, "station": 1}).replace(b"1}", b"2}"),
+    b"zzzzzzzz {}\n"
+])
+def test_corrupt_records_are_rejected(line):
+    with pytest.raises(ValueError):
+        decode(line)
+
+def test_replay_tracks_open_sessions(tmp_path):
+    path = str(tmp_path / "journal.log")
+    write_records(path, [
+        {"op": START, "station": 1, "recipe": "Tur Dal", "elapsed": 0.0},
+        {"op": START, "station": 2, "recipe": "Tomato Soup", "elapsed": 0.0},
+        {"op": PROGRESS, "station": 1, "elapsed": 7.0},
+        {"op": END, "station": 2},
+        {"op": PROGRESS, "station": 3, "elapsed": 1.0}
+    ])
+    sessions, count, valid = replay(path)
+    assert sessions == {1: {"station": 1, "recipe": "Tur Dal", "elapsed": 7.0}}
+    assert count == 5
+    assert valid == os.path.getsize(path)
+
+def test_missing_journal_replays_empty(tmp_path):
+    assert replay(str(tmp_path / "missing.log")) == ({}, 0, 0)
+
+def test_torn_tail_is_truncated(tmp_path):
+    path = str(tmp_path / "journal.log")
+    write_records(path, [
+        {"op": START, "station": 1, "recipe": "Tur Dal", "elapsed": 0.0},
+        {"op": PROGRESS, "station": 1, "elapsed": 4.0}
+    ])
+    valid = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(encode({"op": END, "station": 1})[:-6])
+
+    journal = SessionJournal(path)
+    journal.close()
+    assert journal.interrupted == [{"station": 1, "recipe": "Tur Dal", "elapsed": 4.0}]
+    assert os.path.getsize(path) == valid
+
+def test_cook_events_are_journaled(catalog, tmp_path):
+    path = str(tmp_path / "journal.log")
+    recipe = RecipeStore(catalog).get("Tur Dal")
+    journal = SessionJournal(path, sync_interval=0.01)
+    engine = CookingEngine(SimulatedClock())
+    engine.start(recipe.name, recipe, lambda event: journal.record(3, event))
+    engine.run_until(10.0)
+    journal.close()
+    sessions, _, _ = replay(path)
+    assert sessions[3]["recipe"] == "Tur Dal"
+    assert 8.0 <= sessions[3]["elapsed"] <= 10.0
+
+    journal = SessionJournal(path)
+    journal.discard(3)
+    journal.close()
+    assert replay(path)[0] == {}
+
+def test_compaction_keeps_open_sessions(tmp_path):
+    path = str(tmp_path / "journal.log")
+    journal = SessionJournal(path, sync_interval=0.01, compact_after=10)
+    journal.append({"op": START, "station": 1, "recipe": "Tur Dal", "elapsed": 0.0}, True)
+    journal.append({"op": START, "station": 2, "recipe": "Tomato Soup", "elapsed": 0.0}, True)
+    journal.append({"op": END, "station": 2}, True)
+    for second in range(1, 40):
+        journal.append({"op": PROGRESS, "station": 1, "elapsed": float(second)}, second % 5 == 0)
+    journal.close()
+    sessions, count, _ = replay(path)
+    assert sessions == {1: {"station": 1, "recipe": "Tur Dal", "elapsed": 39.0}}
+    assert count < 10
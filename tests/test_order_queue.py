@@ -0,0 +1,56 @@
+from cooking_engine import SimulatedClock
+from order_queue import OrderQueue
+
+def make_queue(changeover_time=10.0, latency_target=600.0):
+    clock = SimulatedClock()
+    return clock, OrderQueue(clock, changeover_time, latency_target)
+
+def test_shortest_job_goes_first():
+    _, queue = make_queue()
+    queue.submit("Tur Dal", None, 30)
+    short = queue.submit("Tomato Soup", None, 10)
+    assert queue.next_order() is short
+
+def test_same_recipe_avoids_changeover():
+    _, queue = make_queue(changeover_time=10.0)
+    queue.submit("Tomato Soup", None, 15)
+    same = queue.submit("Tur Dal", None, 20)
+    assert queue.next_order("Tur Dal") is same
+
+def test_batches_keep_arrival_order():
+    _, queue = make_queue()
+    first = queue.submit("Tur Dal", None, 20)
+    second = queue.submit("Tur Dal", None, 20)
+    assert [queue.next_order(), queue.next_order(), queue.next_order()] == [first, second, None]
+    assert len(queue) == 0
+
+def test_latency_target_serves_oldest_order():
+    clock, queue = make_queue(latency_target=60.0)
+    old = queue.submit("Tur Dal", None, 100)
+    clock.advance_to(30.0)
+    queue.submit("Tomato Soup", None, 10)
+    clock.advance_to(60.0)
+    assert queue.next_order() is old
+
+def test_requeued_order_keeps_its_place():
+    _, queue = make_queue()
+    first = queue.submit("Tur Dal", None, 20)
+    second = queue.submit("Tur Dal", None, 20)
+    queue.requeue(queue.next_order())
+    assert len(queue) == 2
+    assert [queue.next_order(), queue.next_order()] == [first, second]
+
+def test_cancel():
+    _, queue = make_queue()
+    order = queue.submit("Tur Dal", None, 20)
+    assert queue.cancel(order)
+    assert not queue.cancel(order)
+    assert len(queue) == 0 and not queue.batches
+
+def test_estimate_simulates_stations():
+    _, queue = make_queue(changeover_time=10.0)
+    first = queue.submit("Tur Dal", None, 20)
+    second = queue.submit("Tur Dal", None, 20)
+    soup = queue.submit("Tomato Soup", None, 5)
+    assert queue.estimate([(0.0, None), (0.0, None)]) == {soup.order_id: 0.0, first.order_id: 0.0, second.order_id: 15.0}
+    assert len(queue) == 3
@@ -0,0 +1,32 @@
+import pytest
+
+from cooking_engine import plan_duration, plan_modules, planned_minutes
+
+def spans(slots):
+    return [(slot.start, slot.end) for slot in slots]
+
+def test_modules_without_after_run_in_sequence(make_recipe):
+    slots = plan_modules(make_recipe([("A", 5, None), ("B", 3, None)]))
+    assert spans(slots) == [(0, 5), (5, 8)]
+
+def test_after_lists_run_modules_in_parallel(make_recipe):
+    slots = plan_modules(make_recipe([("A", 5, []), ("B", 3, []), ("C", 2, ["A", "B"])]))
+    assert spans(slots) == [(0, 5), (0, 3), (5, 7)]
+
+def test_default_duration_splits_recipe_time(make_recipe):
+    slots = plan_modules(make_recipe([("A", None, None), ("B", None, None)], time=1))
+    assert spans(slots) == [(0, 30), (30, 60)]
+
+def test_plan_duration_counts_overlap_once(make_recipe):
+    recipe = make_recipe([("A", 48, []), ("B", 30, []), ("C", 12, ["A", "B"])])
+    assert plan_duration(recipe) == 60
+    assert planned_minutes(recipe) == 1.0
+
+@pytest.mark.parametrize("modules, message", [
+    ([("A", 1, ["B"]), ("B", 1, ["A"])], "cycle"),
+    ([("A", 1, ["Z"])], "unknown module Z"),
+    ([("A", 1, None), ("A", 1, None)], "unique")
+])
+def test_invalid_plans_are_rejected(make_recipe, modules, message):
+    with pytest.raises(ValueError, match=message):
+        make_recipe(modules)
@@ -0,0 +1,82 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from conftest import recipe_data
+from recipe_store import Module, Recipe, RecipeStore
+
+def write(catalog, filename, data):
+    with open(os.path.join(catalog, filename), "w", encoding="utf-8") as f:
+        if isinstance(data, str):
+            f.write(data)
+        else:
+            json.dump(data, f)
+
+def test_catalog_compiles_to_records(catalog):
+    store = RecipeStore(catalog)
+    assert store.names() == ["Spinach Soup", "Tomato Soup", "Tur Dal"]
+    recipe = store.get("Tur Dal")
+    assert isinstance(recipe, Recipe)
+    assert isinstance(recipe.modules, tuple) and isinstance(recipe.ingredients, tuple)
+    assert all(isinstance(module, Module) for module in recipe.modules)
+    assert store.get("Tur Dal") is recipe
+
+def test_records_are_read_only(catalog):
+    recipe = RecipeStore(catalog).get("Tur Dal")
+    with pytest.raises(AttributeError):
+        recipe.name = "Other"
+    with pytest.raises(AttributeError):
+        recipe.modules[0].duration = 1
+    with pytest.raises(AttributeError):
+        recipe.extra = 1
+
+def test_records_pickle_and_intern_names(catalog):
+    store = RecipeStore(catalog)
+    recipe = store.get("Tur Dal")
+    copy = pickle.loads(pickle.dumps(recipe))
+    assert [module.name for module in copy.modules] == [module.name for module in recipe.modules]
+    assert copy.modules[1].after == recipe.modules[1].after
+    assert store.get("Tomato Soup").modules[0].name is recipe.modules[0].name
+
+def test_index_is_reused_until_files_change(catalog, monkeypatch):
+    RecipeStore(catalog)
+    monkeypatch.setattr(RecipeStore, "rebuild_index", lambda self, files: pytest.fail("index rebuilt"))
+    assert len(RecipeStore(catalog)) == 3
+
+def test_summary_shows_planned_minutes(catalog):
+    write(catalog, "slow.json", recipe_data([("A", 90, None)], name="Slow", time=15))
+    assert RecipeStore(catalog).summary("Slow")["time"] == 1.5
+
+def test_search_uses_index(catalog):
+    assert RecipeStore(catalog).search.search("dal") == ["Tur Dal"]
+
+def without(key, modules=(("A", 5, None),)):
+    data = recipe_data(modules)
+    del data[key]
+    return data
+
+@pytest.mark.parametrize("data, message", [
+    (without("icon"), "missing icon"),
+    (dict(recipe_data([("A", 5, None)]), time="5"), "time has the wrong type"),
+    (dict(recipe_data([("A", 5, None)]), time=True), "time has the wrong type"),
+    (dict(recipe_data([("A", 5, None)]), time=0), "time must be positive"),
+    (dict(recipe_data([("A", 5, None)]), ingredients=["1 cup water", 2]), "list of strings"),
+    (recipe_data([]), "modules must not be empty"),
+    (recipe_data([("A", 0, None)]), "module 1: duration must be positive"),
+    (recipe_data([("A", 5, ["B"])]), "depends on unknown module B"),
+    (recipe_data([("A", 5, ["B"]), ("B", 5, ["A"])]), "cycle"),
+    ("{not json", "bad.json"),
+    ([], "expected an object")
+])
+def test_invalid_recipes_are_rejected_at_load(catalog, data, message):
+    write(catalog, "bad.json", data)
+    with pytest.raises(ValueError, match=message) as error:
+        RecipeStore(catalog)
+    assert str(error.value).startswith("bad.json: ")
+
+def test_duplicate_names_are_rejected(catalog):
+    write(catalog, "copy.json", recipe_data([("A", 5, None)], name="Tur Dal"))
+    with pytest.raises(ValueError, match="duplicate recipe name Tur Dal"):
+        RecipeStore(catalog)
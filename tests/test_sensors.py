@@ -0,0 +1,54 @@
+import random
+import statistics
+
+import pytest
+
+from sensors import CHANNELS, RollingStats, SensorPipeline, SimulatedSource
+
+def make_pipeline(published, rate=200, **options):
+    return SensorPipeline(SimulatedSource(seed=1), published.append, rate, **options)
+
+def test_rolling_stats_cover_the_last_window():
+    generator = random.Random(3)
+    values = [generator.uniform(0, 100) for _ in range(57)]
+    stats = RollingStats(10)
+    for value in values:
+        stats.add(value)
+    assert stats.count == 10
+    assert stats.mean == pytest.approx(statistics.fmean(values[-10:]))
+    assert stats.stdev == pytest.approx(statistics.pstdev(values[-10:]))
+
+def test_rolling_stats_start_empty():
+    stats = RollingStats(4)
+    assert (stats.mean, stats.stdev) == (0.0, 0.0)
+    stats.add(5.0)
+    assert (stats.mean, stats.stdev) == (5.0, 0.0)
+
+def test_samples_are_decimated_into_buckets():
+    published = []
+    pipeline = make_pipeline(published)
+    for index in range(200):
+        pipeline.ingest(index / 200, (float(index), float(-index)))
+
+    assert len(published) == 4
+    points = [point for snapshot in published for point in snapshot["points"]]
+    assert len(points) == 8
+    when, (temperature, motor_rpm) = points[1]
+    assert when == pytest.approx(49 / 200)
+    assert temperature == pytest.approx((25.0, 49.0, 37.0))
+    assert motor_rpm == pytest.approx((-49.0, -25.0, -37.0))
+
+def test_snapshots_carry_window_stats():
+    published = []
+    pipeline = make_pipeline(published, window=0.25)
+    for index in range(100):
+        pipeline.ingest(index / 200, (float(index), 1.0))
+    assert published[-1]["mean"] == pytest.approx((statistics.fmean(range(50, 100)), 1.0))
+    assert published[-1]["stdev"][1] == pytest.approx(0.0)
+
+def test_recent_reads_across_the_ring():
+    pipeline = make_pipeline([], capacity=8)
+    for index in range(13):
+        pipeline.ingest(index, (float(index), 0.0))
+    assert list(pipeline.recent(CHANNELS[0], 6)) == [7.0, 8.0, 9.0, 10.0, 11.0, 12.0]
+    assert len(pipeline.recent(CHANNELS[0], 50)) == 8
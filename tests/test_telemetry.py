@@ -0,0 +1,45 @@
+import pytest
+
+from cooking_engine import CookingEngine, SimulatedClock
+from recipe_store import RecipeStore
+from telemetry import TelemetryBuffer, TelemetryReader, TelemetryRecorder
+
+def record_sessions(catalog, path, starts):
+    recipe = RecipeStore(catalog).get("Tur Dal")
+    clock = SimulatedClock()
+    engine = CookingEngine(clock)
+    recorder = TelemetryRecorder(path, capacity=1024, clock=clock.now)
+    engine.add_observer(recorder.on_event)
+    for elapsed, stop_at in starts:
+        session = engine.start(recipe.name, recipe, None, 1.0, elapsed)
+        if stop_at is None:
+            engine.run_until_idle()
+        else:
+            engine.run_until(clock.now() + stop_at)
+            engine.stop(session)
+    recorder.close()
+    return TelemetryReader(path).summarize(["Tur Dal"])["Tur Dal"]
+
+def test_completed_sessions_are_summarized(catalog, tmp_path):
+    stats = record_sessions(catalog, str(tmp_path / "telemetry.bin"), [(0.0, None), (0.0, None), (0.0, 5.0)])
+    assert (stats["sessions"], stats["completed"], stats["stopped"], stats["resumed"]) == (3, 2, 1, 0)
+    assert stats["mean_duration"] == pytest.approx(24.0)
+    assert stats["mean_overrun"] == pytest.approx(0.0)
+    assert stats["mean_module_durations"] == pytest.approx({0: 6.0, 1: 4.0, 2: 5.0, 3: 3.0, 4: 12.0, 5: 12.0})
+
+def test_resumed_sessions_are_left_out_of_durations(catalog, tmp_path):
+    stats = record_sessions(catalog, str(tmp_path / "telemetry.bin"), [(13.0, None)])
+    assert (stats["sessions"], stats["completed"], stats["resumed"]) == (1, 1, 1)
+    assert stats["mean_duration"] is None
+    assert 0.0 not in stats["mean_module_durations"].values()
+
+def test_ring_keeps_the_newest_records_across_reopen(tmp_path):
+    path = str(tmp_path / "telemetry.bin")
+    for whens in (range(3), range(3, 7)):
+        buffer = TelemetryBuffer(path, capacity=4)
+        for when in whens:
+            buffer.append(float(when), 1, 0, 0)
+        buffer.close()
+    reader = TelemetryReader(path)
+    assert [record[0] for record in reader.records()] == [3.0, 4.0, 5.0, 6.0]
+    assert (reader.write_index, reader.run) == (7, 2)
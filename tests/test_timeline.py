@@ -0,0 +1,29 @@
+import pytest
+
+from conftest import random_dag, reference_active, reference_states
+from cooking_engine import MODULE_DONE, compile_timeline
+
+@pytest.mark.parametrize("seed", range(5))
+def test_timeline_lookup_matches_linear_scan(make_recipe, seed):
+    recipe = random_dag(make_recipe, 30, seed)
+    timeline = compile_timeline(recipe)
+    points = set(timeline.boundaries)
+    points.update((low + high) / 2 for low, high in zip(timeline.boundaries, timeline.boundaries[1:]))
+    for elapsed in sorted(points):
+        if elapsed >= timeline.total:
+            continue
+        assert timeline.active_slots(elapsed) == reference_active(timeline.slots, elapsed)
+        assert timeline.module_states(elapsed) == reference_states(timeline.slots, elapsed)
+
+def test_timelines_are_cached_per_plan(make_recipe):
+    recipe = make_recipe([("A", 5, None)])
+    assert compile_timeline(recipe) is compile_timeline(make_recipe([("A", 5, None)]))
+    assert compile_timeline(recipe) is not compile_timeline(make_recipe([("A", 6, None)]))
+
+def test_boundaries_and_remaining(make_recipe):
+    timeline = compile_timeline(make_recipe([("A", 5, []), ("B", 3, []), ("C", 2, ["A", "B"])]))
+    assert timeline.boundaries == [0.0, 3, 5, 7]
+    assert [timeline.next_boundary(elapsed) for elapsed in (0.0, 3.0, 4.9)] == [3, 5, 5]
+    assert [timeline.remaining(elapsed) for elapsed in (0.0, 6.5, 7.0)] == [7, 1, 0]
+    assert timeline.module_progress(1.5) == pytest.approx((0.3, 0.5))
+    assert timeline.module_states(7.0) == (MODULE_DONE,) * 3
@@ -1,97 +1,833 @@
+import time
+
+STARTED = time.perf_counter()
+
 import tkinter as tk
 import customtkinter as ctk
-import threading
-import time
+import math
+import os
+import queue
+import sys
+from collections import OrderedDict, deque
+import cooking_engine
+from cooking_engine import CookingEngine
+from fonts import FontRegistry, GlyphCache
+from journal import SessionJournal
+from order_queue import OrderQueue
+from recipe_store import RecipeStore
+from sensors import SensorHub, SensorPipeline
+from telemetry import TelemetryRecorder
 
-class RecipeManager:
-    RECIPES = {
-        "Tomato Soup": {
-            "icon": "🍅",
-            "color": "#FF6B6B",
-            "time": 0.5,
-            "description": "Tangy Tomato Soup with Herbs",
-            "ingredients": [
-                "4 large ripe tomatoes (or 2 cups canned tomatoes)",
-                "1 small onion, chopped",
-                "2 cloves garlic, minced",
-                "1 cup vegetable or chicken broth",
-                "1/2 cup water",
-                "1 tbsp butter or olive oil",
-                "1/2 tsp sugar (optional, to balance acidity)",
-                "1/2 tsp salt (adjust to taste)",
-                "1/4 tsp black pepper",
-                "1/4 tsp red chili flakes (optional, for spice)",
-                "1/2 cup milk or heavy cream (for a creamy version)",
-                "Fresh basil leaves (for garnish)",
-                "Croutons (optional)"
-            ],
-            "modules": [
-                {"name": "Hopper", "action": "Dispensing tomatoes", "emoji": "🍅"},
-                {"name": "Spice", "action": "Adding basil and pepper", "emoji": "🌿"},
-                {"name": "Water", "action": "Adding 500ml water", "emoji": "💧"},
-                {"name": "Cooktop", "action": "Heating to 90°C", "emoji": "🔥"},
-                {"name": "Motor", "action": "Stirring at medium speed", "emoji": "🔄"}
-            ]
-        },
-        "Spinach Soup": {
-            "icon": "🥬",
-            "color": "#45B7D1",
-            "time": 0.5,
-            "description": "Healthy Spinach Soup",
-            "ingredients": [
-                "2 bunches fresh spinach leaves, washed and chopped",
-                "1 medium onion, chopped",
-                "3 cloves garlic, minced",
-                "2 cups vegetable broth",
-                "400ml water",
-                "15ml olive oil",
-                "1/2 tsp salt",
-                "1/4 tsp black pepper",
-                "1/4 tsp nutmeg",
-                "1 tbsp lemon juice",
-                "1/4 cup cream (optional)"
-            ],
-            "modules": [
-                {"name": "Hopper", "action": "Dispensing spinach leaves", "emoji": "🥬"},
-                {"name": "Spice", "action": "Adding garlic and salt", "emoji": "🧄"},
-                {"name": "Water", "action": "Adding 400ml water", "emoji": "💧"},
-                {"name": "Oil", "action": "Adding 15ml olive oil", "emoji": "🫒"},
-                {"name": "Cooktop", "action": "Heating to 85°C", "emoji": "🔥"},
-                {"name": "Motor", "action": "Blending at high speed", "emoji": "🌪️"}
-            ]
-        },
-        "Tur Dal": {
-            "icon": "🍲",
-            "color": "#D35400",
-            "time": 0.5,
-            "description": "Spicy Lentil Soup",
-            "ingredients": [
-                "1 cup tur dal (split pigeon peas)",
-                "1 medium onion, finely chopped",
-                "1 tomato, chopped",
-                "2 green chilies, slit",
-                "1 tsp ginger-garlic paste",
-                "1/2 tsp turmeric powder",
-                "1 tsp cumin seeds",
-                "1 tsp red chili powder",
-                "600ml water",
-                "20ml ghee",
-                "Salt to taste",
-                "Fresh coriander leaves for garnish"
-            ],
-            "modules": [
-                {"name": "Hopper", "action": "Dispensing tur dal", "emoji": "🌱"},
-                {"name": "Spice", "action": "Adding turmeric and cumin", "emoji": "🌶️"},
-                {"name": "Water", "action": "Adding 600ml water", "emoji": "💧"},
-                {"name": "Oil", "action": "Adding 20ml ghee", "emoji": "🧈"},
-                {"name": "Cooktop", "action": "Heating to 95°C", "emoji": "🔥"},
-                {"name": "Motor", "action": "Stirring at low speed", "emoji": "🔄"}
-            ]
-        }
+IMPORTED = time.perf_counter()
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recipes")
+DATA_DIR = os.environ.get("CHEFX_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+SENSOR_WINDOW = 30 * 60
+SENSOR_HISTORY = SENSOR_WINDOW * 8
+SENSOR_POLL_INTERVAL = 250
+CONTROL_POLL_INTERVAL = 50
+STATUS_TIMEOUT = 4000
+CONTROLLERS = ("thread", "process")
+
+def env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("", "0", "false", "no", "off")
+
+def env_rate(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = 0
+    if not rate > 0:
+        sys.stderr.write(f"CHEF X ignoring {name}={value!r}: expected a positive number\n")
+        return default
+    return rate
+
+def env_port(name):
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        port = int(value)
+    except ValueError:
+        port = -1
+    if not 0 <= port <= 65535:
+        sys.stderr.write(f"CHEF X ignoring {name}={value!r}: expected a port number\n")
+        return None
+    return port
+
+def env_choice(name, choices, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    if value not in choices:
+        sys.stderr.write(f"CHEF X ignoring {name}={value!r}: expected one of {', '.join(choices)}\n")
+        return default
+    return value
+
+class ViewCache:
+    def __init__(self, max_widgets=1200, max_views=16):
+        self.max_widgets = max_widgets
+        self.max_views = max_views
+        self.widget_count = 0
+        self._views = OrderedDict()
+
+    def get(self, key):
+        entry = self._views.get(key)
+        if entry is None:
+            return None
+        self._views.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, view):
+        self.discard(key)
+        count = self.count_widgets(self.frame_of(view))
+        self._views[key] = (view, count)
+        self.widget_count += count
+        self.evict(keep=key)
+
+    def discard(self, key):
+        entry = self._views.pop(key, None)
+        if entry is not None:
+            self.widget_count -= entry[1]
+            self.frame_of(entry[0]).destroy()
+
+    def evict(self, keep=None):
+        while len(self._views) > 1 and (
+            self.widget_count > self.max_widgets or len(self._views) > self.max_views
+        ):
+            key = next(iter(self._views))
+            if key == keep:
+                break
+            self.discard(key)
+
+    def clear(self):
+        for key in list(self._views):
+            self.discard(key)
+
+    def __contains__(self, key):
+        return key in self._views
+
+    def __len__(self):
+        return len(self._views)
+
+    @staticmethod
+    def frame_of(view):
+        return getattr(view, "frame", view)
+
+    @staticmethod
+    def count_widgets(widget):
+        count = 0
+        stack = [widget]
+        while stack:
+            current = stack.pop()
+            count += 1
+            stack.extend(current.winfo_children())
+        return count
+
+class CookingScreen:
+    def __init__(self, frame):
+        self.frame = frame
+        self.progress_ring = None
+        self.status_label = None
+        self.active_module_emoji = None
+        self.active_module_name = None
+        self.active_module_action = None
+        self.sensor_label = None
+        self.progress = None
+        self.time_remaining = None
+        self.stop_button = None
+        self.status_dots = []
+        self.chart = None
+        self.color = None
+
+class RecipeCard:
+    def __init__(self, parent, app):
+        self.app = app
+        self.recipe_name = None
+        
+        self.frame = ctk.CTkFrame(
+            parent,
+            fg_color=app.card_color,
+            corner_radius=15,
+            border_width=1,
+            border_color=app.card_border,
+            height=180,
+            width=365
+        )
+        
+        self.color_indicator = ctk.CTkFrame(
+            self.frame,
+            width=8,
+            height=140,
+            corner_radius=4,
+            fg_color=app.card_border
+        )
+        self.color_indicator.place(x=15, y=20)
+        
+        self.recipe_icon = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=app.fonts.get("SF Pro", 36)
+        )
+        self.recipe_icon.place(x=35, y=20)
+        
+        self.name_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=app.fonts.get("SF Pro Display", 18, "bold"),
+            text_color=app.text_color
+        )
+        self.name_label.place(x=100, y=20)
+        
+        self.desc_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=app.fonts.get("SF Pro", 12),
+            text_color=app.secondary_text,
+            wraplength=250,
+            justify="left"
+        )
+        self.desc_label.place(x=100, y=45)
+        
+        self.ingredients_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=app.fonts.get("SF Pro", 12),
+            text_color=app.secondary_text
+        )
+        self.ingredients_label.place(x=100, y=70)
+        
+        self.time_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=app.fonts.get("SF Pro", 12),
+            text_color=app.secondary_text
+        )
+        self.time_label.place(x=35, y=140)
+        
+        self.view_button = ctk.CTkButton(
+            self.frame,
+            text="PREPARE",
+            command=self.prepare,
+            font=app.fonts.get("SF Pro Display", 13, "bold"),
+            fg_color=app.accent_color,
+            hover_color="#E64A00",
+            corner_radius=20,
+            width=100,
+            height=30
+        )
+        self.view_button.place(x=235, y=135)
+
+    def bind(self, recipe_name, summary):
+        if recipe_name == self.recipe_name:
+            return
+        self.recipe_name = recipe_name
+        self.color_indicator.configure(fg_color=summary["color"])
+        self.app.set_glyph(self.recipe_icon, summary["icon"], 36)
+        self.name_label.configure(text=recipe_name)
+        self.desc_label.configure(text=summary["description"])
+        self.ingredients_label.configure(text=f"🧪 {summary['ingredient_count']} ingredients")
+        self.time_label.configure(text=f"⏱️ {summary['time']:g} min")
+
+    def prepare(self):
+        if self.recipe_name is not None:
+            self.app.view_recipe_detail(self.recipe_name)
+
+class VirtualRecipeGrid:
+    def __init__(self, parent, app, columns=2, row_height=200, header_height=50, overscan=1, cards_per_pass=2):
+        self.app = app
+        self.columns = columns
+        self.row_height = row_height
+        self.header_height = header_height
+        self.overscan = overscan
+        self.cards_per_pass = cards_per_pass
+        self.on_filled = None
+        self.items = []
+        self.offset = 0
+        self.visible = {}
+        self.pool = []
+        self.render_pending = False
+        
+        self.frame = ctk.CTkFrame(parent, fg_color=app.bg_color, corner_radius=0)
+        
+        self.scrollbar = ctk.CTkScrollbar(
+            self.frame,
+            command=self.yview,
+            button_color=app.accent_color,
+            button_hover_color=app.accent_color
+        )
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.viewport = tk.Frame(self.frame, bg=app.bg_color, highlightthickness=0)
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.viewport.bind("<Configure>", lambda event: self.schedule_render())
+        
+        self.title_label = ctk.CTkLabel(
+            self.viewport,
+            text="SELECT RECIPE",
+            font=app.fonts.get("SF Pro Display", 14, "bold"),
+            text_color=app.secondary_text
+        )
+        
+        self.frame.bind_all("<MouseWheel>", self.on_mouse_wheel, add="+")
+        self.frame.bind_all("<Button-4>", self.on_mouse_wheel, add="+")
+        self.frame.bind_all("<Button-5>", self.on_mouse_wheel, add="+")
+
+    def set_items(self, items):
+        self.items = list(items)
+        self.offset = 0
+        self.schedule_render()
+
+    def content_height(self):
+        rows = (len(self.items) + self.columns - 1) // self.columns
+        return self.header_height + rows * self.row_height
+
+    def max_offset(self):
+        return max(0, self.content_height() - self.viewport.winfo_height())
+
+    def scroll_to(self, offset):
+        offset = min(max(0, int(offset)), self.max_offset())
+        if offset != self.offset:
+            self.offset = offset
+            self.schedule_render()
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self.content_height())
+        elif args[0] == "scroll":
+            step = self.viewport.winfo_height() if args[2] == "pages" else self.row_height // 4
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def on_mouse_wheel(self, event):
+        if not str(event.widget).startswith(str(self.viewport)) or not self.frame.winfo_ismapped():
+            return
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + delta * self.row_height // 4)
+
+    def schedule_render(self):
+        if not self.render_pending:
+            self.render_pending = True
+            self.frame.after_idle(self.render)
+
+    def render(self):
+        self.render_pending = False
+        width = self.viewport.winfo_width()
+        height = self.viewport.winfo_height()
+        if width <= 1 or height <= 1:
+            return
+        self.offset = min(self.offset, self.max_offset())
+        
+        self.title_label.configure(text="SELECT RECIPE" if self.items else "NO MATCHING RECIPES")
+        self.title_label.place(x=20, y=15 - self.offset)
+        
+        rows = (len(self.items) + self.columns - 1) // self.columns
+        first_row = max(0, (self.offset - self.header_height) // self.row_height - self.overscan)
+        last_row = min(rows - 1, (self.offset + height - self.header_height) // self.row_height + self.overscan)
+        wanted = range(first_row * self.columns, min(len(self.items), (last_row + 1) * self.columns))
+        
+        for index in [index for index in self.visible if index not in wanted]:
+            card = self.visible.pop(index)
+            card.frame.place_forget()
+            self.pool.append(card)
+        
+        card_width = (width - 20) // self.columns - 20
+        created = 0
+        for index in wanted:
+            card = self.visible.get(index)
+            if card is None:
+                if self.pool:
+                    card = self.pool.pop()
+                elif created < self.cards_per_pass:
+                    card = RecipeCard(self.viewport, self.app)
+                    created += 1
+                else:
+                    self.schedule_render()
+                    continue
+                self.visible[index] = card
+            recipe_name = self.items[index]
+            card.bind(recipe_name, self.app.recipes.summary(recipe_name))
+            
+            row, col = divmod(index, self.columns)
+            card.frame.place(
+                x=20 + col * (card_width + 20),
+                y=self.header_height + row * self.row_height + 10 - self.offset,
+                width=card_width,
+                height=self.row_height - 20
+            )
+        
+        total = self.content_height()
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + height) / total))
+        
+        if not self.render_pending and self.on_filled is not None:
+            on_filled, self.on_filled = self.on_filled, None
+            on_filled()
+
+class RenderQueue:
+    def __init__(self, root, frame_interval=16):
+        self.root = root
+        self.frame_interval = frame_interval
+        self.dirty = {}
+        self.flush_id = None
+
+    def mark(self, model):
+        self.dirty[model] = None
+        if self.flush_id is None:
+            self.flush_id = self.root.after(self.frame_interval, self.flush)
+
+    def discard(self, model):
+        self.dirty.pop(model, None)
+
+    def flush(self):
+        self.flush_id = None
+        dirty, self.dirty = self.dirty, {}
+        for model in dirty:
+            model.flush()
+
+class LiveChart:
+    def __init__(self, parent, app, channels, width=760, height=64, window=SENSOR_WINDOW, scroll_step=76):
+        self.channels = channels
+        self.width = width
+        self.height = height
+        self.window = window
+        self.scroll_step = scroll_step
+        self.px_per_second = width / window
+        
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=app.card_color, highlightthickness=0)
+        for fraction in (0.25, 0.5, 0.75):
+            self.canvas.create_line(0, height * fraction, width, height * fraction, fill="#232323")
+        for index, (label, color, low, high) in enumerate(channels):
+            self.canvas.create_text(6 + index * 90, 4, text=label, anchor="nw", fill=color, font=app.fonts.get("SF Pro", 10))
+        self.heads = [self.canvas.create_line(0, 0, 0, 0, fill=color, width=2, state="hidden") for _, color, _, _ in channels]
+        self.reset()
+
+    def reset(self):
+        self.canvas.delete("data")
+        for head in self.heads:
+            self.canvas.itemconfigure(head, state="hidden")
+        self.segments = deque()
+        self.offset = 0
+        self.column = None
+        self.sums = [0.0] * len(self.channels)
+        self.count = 0
+        self.last = [None] * len(self.channels)
+
+    def load(self, points):
+        self.reset()
+        if points:
+            start = points[-1][0] - self.window
+            self.extend(point for point in points if point[0] >= start)
+
+    def scale(self, channel, value):
+        _, _, low, high = self.channels[channel]
+        fraction = min(1.0, max(0.0, (value - low) / (high - low)))
+        return self.height - 2 - fraction * (self.height - 4)
+
+    def extend(self, points):
+        for when, values in points:
+            column = int(when * self.px_per_second)
+            if column != self.column:
+                if self.count:
+                    self.draw_column()
+                self.column = column
+            for channel, (_, _, mean) in enumerate(values):
+                self.sums[channel] += mean
+            self.count += 1
+        if self.count:
+            self.draw_head()
+
+    def draw_column(self):
+        x = self.column - self.offset
+        if x >= self.width:
+            self.scroll(max(self.scroll_step, x - self.width + 1))
+            x = self.column - self.offset
+        for channel, (_, color, _, _) in enumerate(self.channels):
+            y = self.scale(channel, self.sums[channel] / self.count)
+            previous = self.last[channel]
+            if previous is not None:
+                item = self.canvas.create_line(previous[0] - self.offset, previous[1], x, y, fill=color, width=2, tags="data")
+                self.segments.append((item, self.column))
+            self.last[channel] = (self.column, y)
+            self.sums[channel] = 0.0
+        self.count = 0
+
+    def draw_head(self):
+        x = self.column - self.offset
+        for channel, head in enumerate(self.heads):
+            y = self.scale(channel, self.sums[channel] / self.count)
+            previous = self.last[channel] or (self.column, y)
+            self.canvas.coords(head, previous[0] - self.offset, previous[1], x, y)
+            self.canvas.itemconfigure(head, state="normal")
+
+    def scroll(self, pixels):
+        self.offset += pixels
+        self.canvas.move("data", -pixels, 0)
+        while self.segments and self.segments[0][1] < self.offset:
+            self.canvas.delete(self.segments.popleft()[0])
+
+class Animator:
+    BASE_INTERVAL = 20
+
+    def __init__(self, root, frame_interval=16):
+        self.root = root
+        self.frame_interval = frame_interval
+        self.widgets = []
+        self.enabled = True
+        self.tick_id = None
+        self.root.bind("<Map>", lambda event: self.wake(), add="+")
+
+    def add(self, widget):
+        widget.configure(indeterminate_speed=self.frame_interval / self.BASE_INTERVAL)
+        self.widgets.append(widget)
+        self.wake()
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        if enabled:
+            self.wake()
+        elif self.tick_id is not None:
+            self.root.after_cancel(self.tick_id)
+            self.tick_id = None
+
+    def wake(self):
+        if self.enabled and self.tick_id is None and self.widgets:
+            self.tick_id = self.root.after(self.frame_interval, self.tick)
+
+    def tick(self):
+        self.tick_id = None
+        animating = False
+        for widget in list(self.widgets):
+            if not widget.winfo_exists():
+                self.widgets.remove(widget)
+            elif widget.winfo_viewable():
+                widget.step()
+                animating = True
+        if animating:
+            self.wake()
+
+def visible_progress(widget, value):
+    pixels = widget.winfo_width()
+    if pixels <= 1:
+        return value
+    return round(value * pixels) / pixels
+
+class ViewModel:
+    def __init__(self, queue):
+        self.queue = queue
+        self.rendered = {}
+        self.pending = {}
+
+    def bind_state(self, state, known=None):
+        self.cancel()
+        self.rendered = dict(known) if known else {}
+        self.pending = dict(state)
+        self.flush()
+
+    def update(self, **state):
+        self.pending.update(state)
+        self.queue.mark(self)
+
+    def cancel(self):
+        self.pending = {}
+        self.queue.discard(self)
+
+    def flush(self):
+        pending, self.pending = self.pending, {}
+        for key, value in pending.items():
+            value = self.normalize(key, value)
+            if key not in self.rendered or self.rendered[key] != value:
+                self.rendered[key] = value
+                self.render(key, value)
+
+    def normalize(self, key, value):
+        return value
+
+    def render(self, key, value):
+        raise NotImplementedError
+
+class CookingViewModel(ViewModel):
+    INITIAL_STATE = {
+        "status": "INITIALIZING...",
+        "emoji": "🔄",
+        "module_name": "INITIALIZING",
+        "module_action": "Preparing to cook...",
+        "progress": 0,
+        "time_remaining": "0:30",
+        "module_states": (),
+        "sensors": "",
+        "finished": False
+    }
+
+    def __init__(self, app):
+        super().__init__(app.render_queue)
+        self.app = app
+        self.screen = None
+
+    def bind(self, screen, state, fresh):
+        self.screen = screen
+        self.bind_state(state, self.INITIAL_STATE if fresh else None)
+
+    def normalize(self, key, value):
+        if key == "progress":
+            return visible_progress(self.screen.progress, value)
+        return value
+
+    def render(self, key, value):
+        screen = self.screen
+        if key == "progress":
+            screen.progress.set(value)
+        elif key == "time_remaining":
+            screen.time_remaining.configure(text=value)
+        elif key == "status":
+            screen.status_label.configure(text=value)
+        elif key == "emoji":
+            self.app.set_glyph(screen.active_module_emoji, value, 100)
+        elif key == "module_name":
+            screen.active_module_name.configure(text=value)
+        elif key == "module_action":
+            screen.active_module_action.configure(text=value)
+        elif key == "sensors":
+            if screen.sensor_label is not None:
+                screen.sensor_label.configure(text=value)
+        elif key == "module_states":
+            for i, dot in enumerate(screen.status_dots):
+                state = value[i] if i < len(value) else cooking_engine.MODULE_PENDING
+                if state == cooking_engine.MODULE_DONE:
+                    color = self.app.success_color
+                elif state == cooking_engine.MODULE_ACTIVE:
+                    color = screen.color
+                else:
+                    color = "#333333"
+                dot.configure(fg_color=color, hover_color=color)
+        elif key == "finished":
+            if value:
+                screen.stop_button.configure(
+                    text="DONE",
+                    fg_color=self.app.accent_color,
+                    hover_color="#E64A00",
+                    command=self.app.show_recipe_cards
+                )
+            else:
+                screen.stop_button.configure(
+                    text="STOP",
+                    fg_color=self.app.danger_color,
+                    hover_color="#D32F2F",
+                    command=self.app.stop_cooking
+                )
+
+class Station:
+    IDLE_STATE = {
+        "recipe": "Available",
+        "status": "IDLE",
+        "emoji": "⚪",
+        "module_name": "",
+        "module_action": "",
+        "progress": 0,
+        "time_remaining": "",
+        "module_states": (),
+        "sensors": "",
+        "finished": False
     }
 
+    def __init__(self, number):
+        self.number = number
+        self.session = None
+        self.recipe_name = None
+        self.last_recipe = None
+        self.state = dict(self.IDLE_STATE)
+        self.tile = None
+        self.sensors = None
+        self.sensor_history = deque(maxlen=SENSOR_HISTORY)
+        self.active_modules = ()
+
+    @property
+    def busy(self):
+        return self.session is not None
+
+    def free_at(self, now):
+        if self.session is None:
+            return now
+        return self.session.start_time + self.session.total_time
+
+    def reset(self):
+        self.session = None
+        self.recipe_name = None
+        self.state = dict(self.IDLE_STATE)
+        self.active_modules = ()
+
+class StationTile(ViewModel):
+    def __init__(self, parent, app, station):
+        super().__init__(app.render_queue)
+        self.app = app
+        self.station = station
+        
+        self.frame = ctk.CTkFrame(
+            parent,
+            fg_color=app.card_color,
+            corner_radius=15,
+            border_width=1,
+            border_color=app.card_border
+        )
+        self.frame.bind("<Button-1>", lambda event: app.open_station(station))
+        
+        number_label = ctk.CTkLabel(
+            self.frame,
+            text=f"STATION {station.number}",
+            font=app.fonts.get("SF Pro Display", 12, "bold"),
+            text_color=app.secondary_text
+        )
+        number_label.pack(anchor="w", padx=15, pady=(10, 0))
+        
+        self.recipe_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=app.fonts.get("SF Pro Display", 16, "bold"),
+            text_color=app.text_color
+        )
+        self.recipe_label.pack(anchor="w", padx=15)
+        
+        module_row = ctk.CTkFrame(self.frame, fg_color="transparent")
+        module_row.pack(fill="x", padx=15)
+        
+        self.module_emoji = ctk.CTkLabel(
+            module_row,
+            text="",
+            font=app.fonts.get("SF Pro", 14),
+            width=20
+        )
+        self.module_emoji.pack(side="left")
+        
+        self.module_label = ctk.CTkLabel(
+            module_row,
+            text="",
+            font=app.fonts.get("SF Pro", 12),
+            text_color=app.secondary_text
+        )
+        self.module_label.pack(side="left", padx=(5, 0))
+        
+        self.progress = ctk.CTkProgressBar(
+            self.frame,
+            height=6,
+            fg_color="#232323",
+            progress_color=app.accent_color,
+            corner_radius=3
+        )
+        self.progress.pack(fill="x", padx=15, pady=(5, 0))
+        self.progress.set(0)
+        
+        footer = ctk.CTkFrame(self.frame, fg_color="transparent")
+        footer.pack(fill="x", padx=15, pady=(0, 10))
+        
+        self.status_label = ctk.CTkLabel(
+            footer,
+            text="",
+            font=app.fonts.get("SF Pro Display", 12),
+            text_color=app.accent_color
+        )
+        self.status_label.pack(side="left")
+        
+        self.time_label = ctk.CTkLabel(
+            footer,
+            text="",
+            font=app.fonts.get("SF Pro Display", 14, "bold"),
+            text_color=app.text_color
+        )
+        self.time_label.pack(side="right")
+        
+        for widget in (number_label, self.recipe_label, self.module_emoji, self.module_label, self.status_label, self.time_label):
+            widget.bind("<Button-1>", lambda event: app.open_station(station))
+        
+        self.bind_state(station.state)
+
+    def normalize(self, key, value):
+        if key == "progress":
+            return visible_progress(self.progress, value)
+        return value
+
+    def render(self, key, value):
+        if key == "recipe":
+            self.recipe_label.configure(text=value)
+        elif key == "emoji":
+            self.module_emoji.configure(text=value)
+        elif key == "module_name":
+            self.module_label.configure(text=value)
+        elif key == "progress":
+            self.progress.set(value)
+        elif key == "status":
+            self.status_label.configure(text=value)
+        elif key == "time_remaining":
+            self.time_label.configure(text=value)
+
+class TkEngineDriver:
+    def __init__(self, root, engine):
+        self.root = root
+        self.engine = engine
+        self.after_id = None
+        self.deadline = None
+        engine.on_schedule = self.arm
+
+    def arm(self):
+        deadline = self.engine.next_deadline()
+        if deadline == self.deadline:
+            return
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.deadline = deadline
+        if deadline is not None:
+            delay = deadline - self.engine.clock.now()
+            self.after_id = self.root.after(max(1, math.ceil(delay * 1000)), self.fire)
+
+    def fire(self):
+        self.after_id = None
+        self.deadline = None
+        self.engine.run_due()
+        self.arm()
+
 class LuxuryCookingApp:
-    def __init__(self):
+    def __init__(self, catalog_dir=CATALOG_DIR, station_count=4, recipe_cache_size=32, view_cache_widgets=1200, view_cache_views=16,
+                 telemetry_path=os.path.join(DATA_DIR, "telemetry.bin"), changeover_time=10.0, latency_target=600.0,
+                 control_port=None, control_socket=None,
+                 inventory_path=os.path.join(DATA_DIR, "inventory.json"), profile_path=None,
+                 stall_threshold=0.1, frame_rate=None,
+                 low_power=None, low_power_frame_rate=4,
+                 journal_path=os.path.join(DATA_DIR, "journal.log"), sensor_source=None, sensor_rate=200,
+                 controller=None):
+        self.started = time.perf_counter()
+        if frame_rate is None:
+            frame_rate = env_rate("CHEFX_FRAME_RATE", 60)
+        if low_power is None:
+            low_power = env_flag("CHEFX_LOW_POWER")
+        if control_port is None:
+            control_port = env_port("CHEFX_CONTROL_PORT")
+        if control_socket is None:
+            control_socket = os.environ.get("CHEFX_CONTROL_SOCKET") or None
+        if profile_path is None:
+            profile_path = os.environ.get("CHEFX_PROFILE") or None
+        if controller is None:
+            controller = env_choice("CHEFX_CONTROLLER", CONTROLLERS, "thread")
+        if not frame_rate > 0 or not low_power_frame_rate > 0:
+            raise ValueError("frame rates must be positive")
+        if control_port is not None and not 0 <= control_port <= 65535:
+            raise ValueError("control port must be between 0 and 65535")
+        if controller not in CONTROLLERS:
+            raise ValueError(f"controller must be one of {', '.join(CONTROLLERS)}")
+        self.profile_path = profile_path
+        self.profiler = None
+        if profile_path is not None:
+            from profiler import MainLoopProfiler
+            self.profiler = MainLoopProfiler(stall_threshold)
+            self.profiler.install()
         ctk.set_appearance_mode("system")
         ctk.set_default_color_theme("blue")
 
@@ -101,11 +837,71 @@ class LuxuryCookingApp:
         self.root.config(bg="#0A0A0A")
         self.root.resizable(False, False)
 
+        self.fonts = FontRegistry()
+        self.glyphs = GlyphCache()
+
+        self.catalog_dir = catalog_dir
+        self.recipe_cache_size = recipe_cache_size
+        self.recipes = None
+        self.inventory_path = inventory_path
+        self.inventory = None
+        self.startup_timings = {"imports": IMPORTED - STARTED}
         self.current_recipe = tk.StringVar(value="")
-        self.cooking_thread = None
-        self.is_cooking = False
+        if controller == "process":
+            from actuation import ProcessEngine
+            self.engine = ProcessEngine(station_count)
+        else:
+            self.engine = CookingEngine()
+        self.engine_driver = TkEngineDriver(self.root, self.engine)
+        self.connect_delay = 1.0
+        self.orders = OrderQueue(self.engine.clock, changeover_time, latency_target)
+        self.queue_refresh_id = None
+        self.status_clear_id = None
+        self.telemetry = None
+        if telemetry_path is not None:
+            self.telemetry = TelemetryRecorder(telemetry_path)
+            self.engine.add_observer(self.telemetry.on_event)
+        self.journal = None
+        if journal_path is not None:
+            self.journal = SessionJournal(journal_path)
+        self.resume_banner = None
+        self.sensor_source = sensor_source
+        self.sensor_rate = sensor_rate
+        self.sensor_hub = SensorHub(sensor_rate)
+        self.sensor_updates = queue.SimpleQueue()
+        self.sensor_poll_id = None
+        self.stations = [Station(number) for number in range(1, station_count + 1)]
+        self.active_station = None
+        self.control_server = None
+        self.control_commands = queue.SimpleQueue()
+        if control_port is not None or control_socket:
+            from control_server import ControlServer
+            self.control_server = ControlServer(
+                self.control_commands.put,
+                {"recipes": self.api_recipes, "start": self.submit_recipe, "stop": self.api_stop},
+                port=control_port or 0,
+                unix_path=control_socket
+            )
+            try:
+                self.control_server.start()
+            except OSError as error:
+                sys.stderr.write(f"CHEF X control API disabled: {error}\n")
+                self.control_server = None
+            else:
+                for station in self.stations:
+                    self.control_server.publish(station.number, station.state)
+                self.root.after(CONTROL_POLL_INTERVAL, self.poll_control)
         self.active_module = None
-        self.card_widgets = {}
+        self.recipe_grid = None
+        self.view_cache = ViewCache(view_cache_widgets, view_cache_views)
+        self.current_detail = None
+        self.current_cooking = None
+        self.frame_interval = max(1, round(1000 / frame_rate))
+        self.low_power_interval = max(1, round(1000 / low_power_frame_rate))
+        self.low_power = False
+        self.render_queue = RenderQueue(self.root, self.frame_interval)
+        self.animator = Animator(self.root, self.frame_interval)
+        self.cooking_model = CookingViewModel(self)
 
         self.bg_color = "#0A0A0A"
         self.card_color = "#161616"
@@ -119,8 +915,14 @@ class LuxuryCookingApp:
         self.card_hover = "#222222"
         self.card_border = "#2A2A2A"
 
+        self.set_low_power(low_power)
         self.create_ui()
 
+    def set_low_power(self, enabled):
+        self.low_power = enabled
+        self.render_queue.frame_interval = self.low_power_interval if enabled else self.frame_interval
+        self.animator.set_enabled(not enabled)
+
     def create_ui(self):
         self.main_container = ctk.CTkFrame(self.root, fg_color=self.bg_color, corner_radius=0)
         self.main_container.pack(fill="both", expand=True, padx=0, pady=0)
@@ -131,16 +933,108 @@ class LuxuryCookingApp:
         self.create_content_area()
         self.create_cooking_view()
         self.show_recipe_cards()
+        
+        self.root.update()
+        self.mark_startup("first_paint")
+        self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        try:
+            self.recipes = RecipeStore(self.catalog_dir, self.recipe_cache_size)
+        except (OSError, ValueError) as error:
+            self.loading_label.configure(text=f"CATALOG REJECTED · {error}".upper())
+            return
+        if self.inventory_path is not None and os.path.exists(self.inventory_path):
+            from inventory import Inventory
+            self.inventory = Inventory.load(self.recipes, self.inventory_path)
+        self.mark_startup("recipes_loaded")
+        
+        self.loading_label.destroy()
+        self.create_recipe_cards()
+        if self.journal is not None and self.journal.interrupted:
+            self.show_resume_prompt(self.journal.interrupted)
+
+    def show_resume_prompt(self, sessions):
+        lines = []
+        for session in list(sessions):
+            if session["recipe"] not in self.recipes or not 1 <= session["station"] <= len(self.stations):
+                self.journal.discard(session["station"])
+                sessions.remove(session)
+                continue
+            recipe = self.recipes.get(session["recipe"])
+            remaining = math.ceil(cooking_engine.plan_duration(recipe) - session["elapsed"])
+            lines.append(f"STATION {session['station']} · {recipe.icon} {session['recipe']} · {cooking_engine.format_remaining(max(0, remaining))} LEFT")
+        if not lines:
+            return
+        
+        self.resume_banner = ctk.CTkFrame(self.content_area, fg_color=self.card_color, corner_radius=0)
+        self.resume_banner.pack(fill="x", after=self.header)
+        
+        ctk.CTkLabel(
+            self.resume_banner,
+            text="INTERRUPTED COOK" + ("S" if len(lines) > 1 else "") + "\n" + "\n".join(lines),
+            font=self.fonts.get("SF Pro Display", 13, "bold"),
+            text_color=self.text_color,
+            justify="left"
+        ).pack(side="left", padx=20, pady=8)
+        
+        for text, color, command in (
+            ("DISCARD", self.danger_color, lambda: self.close_resume_prompt(sessions, False)),
+            ("RESUME", self.success_color, lambda: self.close_resume_prompt(sessions, True))
+        ):
+            ctk.CTkButton(
+                self.resume_banner,
+                text=text,
+                command=command,
+                fg_color=color,
+                font=self.fonts.get("SF Pro Display", 13, "bold"),
+                corner_radius=15,
+                width=100,
+                height=30
+            ).pack(side="right", padx=(0, 20))
+
+    def close_resume_prompt(self, sessions, resume):
+        self.resume_banner.destroy()
+        self.resume_banner = None
+        resumed = False
+        for session in sessions:
+            station = self.stations[session["station"] - 1]
+            if station.busy:
+                continue
+            if not resume:
+                self.journal.discard(station.number)
+                continue
+            try:
+                self.start_station(station, session["recipe"], self.recipes.get(session["recipe"]), session["elapsed"])
+            except RuntimeError as error:
+                self.show_status(str(error).upper())
+                break
+            resumed = True
+        if resumed:
+            self.show_stations()
+
+    def set_glyph(self, label, text, size):
+        image = self.glyphs.get(text, size)
+        if image is None:
+            label.configure(text=text)
+        else:
+            label.configure(image=image, text="")
+
+    def mark_startup(self, stage):
+        self.startup_timings[stage] = time.perf_counter() - self.started
+        if stage == "grid_filled":
+            report = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.startup_timings.items())
+            sys.stderr.write(f"CHEF X startup: {report}\n")
 
     def create_content_area(self):
-        header = ctk.CTkFrame(self.content_area, fg_color=self.gradient_top, height=60)
+        header = self.header = ctk.CTkFrame(self.content_area, fg_color=self.gradient_top, height=60)
         header.pack(fill="x", pady=0)
         header.pack_propagate(False)
         
         app_title = ctk.CTkLabel(
             header, 
             text="CHEF X",
-            font=("SF Pro Display", 22, "bold"),
+            font=self.fonts.get("SF Pro Display", 22, "bold"),
             text_color=self.text_color
         )
         app_title.pack(side="left", padx=20)
@@ -148,11 +1042,54 @@ class LuxuryCookingApp:
         status_indicator = ctk.CTkLabel(
             header,
             text="● ONLINE",
-            font=("SF Pro Display", 12),
+            font=self.fonts.get("SF Pro Display", 12),
             text_color=self.success_color
         )
         status_indicator.pack(side="right", padx=20)
         
+        self.queue_label = ctk.CTkLabel(
+            header,
+            text="",
+            font=self.fonts.get("SF Pro Display", 12),
+            text_color=self.accent_color
+        )
+        self.queue_label.pack(side="right")
+        
+        self.status_label = ctk.CTkLabel(
+            header,
+            text="",
+            font=self.fonts.get("SF Pro Display", 12),
+            text_color=self.danger_color
+        )
+        self.status_label.pack(side="right", padx=(0, 15))
+        
+        stations_button = ctk.CTkButton(
+            header,
+            text="STATIONS",
+            command=self.show_stations,
+            fg_color="transparent",
+            text_color=self.accent_color,
+            hover_color="#232323",
+            font=self.fonts.get("SF Pro Display", 13, "bold"),
+            width=90,
+            height=30
+        )
+        stations_button.pack(side="right", padx=(10, 0))
+        
+        self.search_entry = ctk.CTkEntry(
+            header,
+            placeholder_text="Search recipes",
+            font=self.fonts.get("SF Pro", 13),
+            fg_color=self.card_color,
+            border_color=self.card_border,
+            text_color=self.text_color,
+            corner_radius=15,
+            width=240,
+            height=32
+        )
+        self.search_entry.bind("<KeyRelease>", lambda event: self.filter_recipes())
+        self.search_entry.pack(side="right", padx=10)
+        
         self.recipe_container = ctk.CTkFrame(
             self.content_area,
             fg_color=self.bg_color,
@@ -161,128 +1098,54 @@ class LuxuryCookingApp:
         
         self.recipe_detail_view = ctk.CTkFrame(self.content_area, fg_color=self.bg_color)
         
-        self.create_recipe_cards()
-
-    def create_recipe_cards(self):
-        scrollable_container = ctk.CTkScrollableFrame(
+        self.loading_label = ctk.CTkLabel(
             self.recipe_container,
-            fg_color=self.bg_color,
-            corner_radius=0,
-            scrollbar_button_color=self.accent_color,
-            scrollbar_button_hover_color=self.accent_color
-        )
-        scrollable_container.pack(fill="both", expand=True, padx=0, pady=0)
-        
-        title_label = ctk.CTkLabel(
-            scrollable_container,
-            text="SELECT RECIPE",
-            font=("SF Pro Display", 14, "bold"),
+            text="LOADING RECIPES...",
+            font=self.fonts.get("SF Pro Display", 14, "bold"),
             text_color=self.secondary_text
         )
-        title_label.pack(anchor="w", padx=20, pady=(15, 10))
-        
-        recipe_grid = ctk.CTkFrame(scrollable_container, fg_color="transparent")
-        recipe_grid.pack(fill="both", expand=True, padx=10)
-        
-        for i, (recipe_name, recipe_data) in enumerate(RecipeManager.RECIPES.items()):
-            card = ctk.CTkFrame(
-                recipe_grid,
-                fg_color=self.card_color,
-                corner_radius=15,
-                border_width=1,
-                border_color=self.card_border,
-                height=180,
-                width=365
-            )
-            
-            self.card_widgets[recipe_name] = card
-            
-            row = i // 2
-            col = i % 2
-            
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-            
-            recipe_grid.grid_columnconfigure(0, weight=1)
-            recipe_grid.grid_columnconfigure(1, weight=1)
-            
-            card.grid_propagate(False)
-            
-            color_indicator = ctk.CTkFrame(
-                card,
-                width=8,
-                height=140,
-                corner_radius=4,
-                fg_color=recipe_data["color"]
-            )
-            color_indicator.place(x=15, y=20)
-            
-            recipe_icon = ctk.CTkLabel(
-                card,
-                text=recipe_data["icon"],
-                font=("SF Pro", 36)
-            )
-            recipe_icon.place(x=35, y=20)
-            
-            name_label = ctk.CTkLabel(
-                card,
-                text=recipe_name,
-                font=("SF Pro Display", 18, "bold"),
-                text_color=self.text_color
-            )
-            name_label.place(x=100, y=20)
-            
-            desc_label = ctk.CTkLabel(
-                card,
-                text=recipe_data["description"],
-                font=("SF Pro", 12),
-                text_color=self.secondary_text,
-                wraplength=250,
-                justify="left"
-            )
-            desc_label.place(x=100, y=45)
-            
-            ingredient_count = len(recipe_data["ingredients"])
-            ingredients_label = ctk.CTkLabel(
-                card,
-                text=f"🧪 {ingredient_count} ingredients",
-                font=("SF Pro", 12),
-                text_color=self.secondary_text
-            )
-            ingredients_label.place(x=100, y=70)
-            
-            time_label = ctk.CTkLabel(
-                card,
-                text=f"⏱️ {recipe_data['time']} min",
-                font=("SF Pro", 12),
-                text_color=self.secondary_text
-            )
-            time_label.place(x=35, y=140)
-            
-            view_button = ctk.CTkButton(
-                card,
-                text="PREPARE",
-                command=lambda r=recipe_name: self.view_recipe_detail(r),
-                font=("SF Pro Display", 13, "bold"),
-                fg_color=self.accent_color,
-                hover_color="#E64A00",
-                corner_radius=20,
-                width=100,
-                height=30
-            )
-            view_button.place(x=235, y=135)
+        self.loading_label.pack(anchor="w", padx=20, pady=(15, 10))
+
+    def create_recipe_cards(self):
+        self.recipe_grid = VirtualRecipeGrid(self.recipe_container, self)
+        self.recipe_grid.on_filled = lambda: self.mark_startup("grid_filled")
+        self.recipe_grid.frame.pack(fill="both", expand=True, padx=0, pady=0)
+        self.recipe_grid.set_items(self.recipes.names())
+
+    def filter_recipes(self):
+        if self.recipe_grid is None:
+            return
+        self.recipe_grid.set_items(self.recipes.search.search(self.search_entry.get()))
+
+    def set_search(self, text):
+        self.search_entry.delete(0, "end")
+        if text:
+            self.search_entry.insert(0, text)
+        self.filter_recipes()
 
     def view_recipe_detail(self, recipe_name):
         self.current_recipe.set(recipe_name)
-        recipe = RecipeManager.RECIPES[recipe_name]
         
-        self.recipe_container.pack_forget()
+        self.hide_views()
         
-        for widget in self.recipe_detail_view.winfo_children():
-            widget.destroy()
-            
+        if self.current_detail is not None and self.current_detail.winfo_exists():
+            self.current_detail.pack_forget()
+        
+        key = ("detail", recipe_name)
+        page = self.view_cache.get(key)
+        if page is None:
+            page = self.build_recipe_detail(recipe_name)
+            self.view_cache.put(key, page)
+        
+        self.current_detail = page
+        page.pack(fill="both", expand=True, padx=0, pady=0)
         self.recipe_detail_view.pack(fill="both", expand=True, padx=0, pady=0)
+
+    def build_recipe_detail(self, recipe_name):
+        recipe = self.recipes.get(recipe_name)
+        page = ctk.CTkFrame(self.recipe_detail_view, fg_color=self.bg_color, corner_radius=0)
         
-        top_frame = ctk.CTkFrame(self.recipe_detail_view, fg_color=self.gradient_top, height=60)
+        top_frame = ctk.CTkFrame(page, fg_color=self.gradient_top, height=60)
         top_frame.pack(fill="x", pady=0)
         top_frame.pack_propagate(False)
         
@@ -293,7 +1156,7 @@ class LuxuryCookingApp:
             fg_color="transparent",
             text_color=self.accent_color,
             hover_color="#232323",
-            font=("SF Pro Display", 14, "bold"),
+            font=self.fonts.get("SF Pro Display", 14, "bold"),
             width=80,
             height=30
         )
@@ -302,13 +1165,13 @@ class LuxuryCookingApp:
         title_label = ctk.CTkLabel(
             top_frame,
             text=recipe_name,
-            font=("SF Pro Display", 18, "bold"),
+            font=self.fonts.get("SF Pro Display", 18, "bold"),
             text_color=self.text_color
         )
         title_label.pack(side="left", padx=10)
         
         content_frame = ctk.CTkScrollableFrame(
-            self.recipe_detail_view,
+            page,
             fg_color=self.bg_color,
             corner_radius=0,
             scrollbar_button_color=self.accent_color,
@@ -324,21 +1187,22 @@ class LuxuryCookingApp:
             width=10,
             height=50,
             corner_radius=5,
-            fg_color=recipe["color"]
+            fg_color=recipe.color
         )
         color_indicator.place(x=0, y=15)
         
         icon_label = ctk.CTkLabel(
             header_frame,
-            text=recipe["icon"],
-            font=("SF Pro", 50)
+            text="",
+            font=self.fonts.get("SF Pro", 50)
         )
+        self.set_glyph(icon_label, recipe.icon, 50)
         icon_label.place(x=20, y=0)
         
         desc_label = ctk.CTkLabel(
             header_frame,
-            text=recipe["description"],
-            font=("SF Pro", 16),
+            text=recipe.description,
+            font=self.fonts.get("SF Pro", 16),
             text_color=self.text_color,
             justify="left"
         )
@@ -346,8 +1210,8 @@ class LuxuryCookingApp:
         
         time_label = ctk.CTkLabel(
             header_frame,
-            text=f"⏱️ {recipe['time']} min",
-            font=("SF Pro", 13),
+            text=f"⏱️ {cooking_engine.planned_minutes(recipe):g} min",
+            font=self.fonts.get("SF Pro", 13),
             text_color=self.accent_color,
             bg_color="transparent"
         )
@@ -362,7 +1226,7 @@ class LuxuryCookingApp:
         ingredients_title = ctk.CTkLabel(
             details_grid,
             text="INGREDIENTS",
-            font=("SF Pro Display", 14, "bold"),
+            font=self.fonts.get("SF Pro Display", 14, "bold"),
             text_color=self.secondary_text
         )
         ingredients_title.grid(row=0, column=0, sticky="w", pady=(0, 10))
@@ -370,7 +1234,7 @@ class LuxuryCookingApp:
         modules_title = ctk.CTkLabel(
             details_grid,
             text="MODULES",
-            font=("SF Pro Display", 14, "bold"),
+            font=self.fonts.get("SF Pro Display", 14, "bold"),
             text_color=self.secondary_text
         )
         modules_title.grid(row=0, column=1, sticky="w", pady=(0, 10), padx=(20, 0))
@@ -384,16 +1248,16 @@ class LuxuryCookingApp:
         )
         ingredients_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
         
-        for i, ingredient in enumerate(recipe["ingredients"]):
+        for i, ingredient in enumerate(recipe.ingredients):
             ingredient_item = ctk.CTkLabel(
                 ingredients_frame,
                 text=f"• {ingredient}",
-                font=("SF Pro", 13),
+                font=self.fonts.get("SF Pro", 13),
                 text_color=self.text_color,
                 justify="left",
                 anchor="w"
             )
-            ingredient_item.pack(anchor="w", pady=(10 if i == 0 else 5, 10 if i == len(recipe["ingredients"])-1 else 0), padx=15)
+            ingredient_item.pack(anchor="w", pady=(10 if i == 0 else 5, 10 if i == len(recipe.ingredients)-1 else 0), padx=15)
         
         modules_frame = ctk.CTkFrame(
             details_grid,
@@ -404,14 +1268,14 @@ class LuxuryCookingApp:
         )
         modules_frame.grid(row=1, column=1, sticky="nsew", pady=(0, 20), padx=(20, 0))
         
-        for i, module in enumerate(recipe["modules"]):
+        for i, module in enumerate(recipe.modules):
             module_frame = ctk.CTkFrame(modules_frame, fg_color="transparent")
-            module_frame.pack(fill="x", pady=(10 if i == 0 else 5, 10 if i == len(recipe["modules"])-1 else 0), padx=15)
+            module_frame.pack(fill="x", pady=(10 if i == 0 else 5, 10 if i == len(recipe.modules)-1 else 0), padx=15)
             
             module_emoji = ctk.CTkLabel(
                 module_frame,
-                text=module["emoji"],
-                font=("SF Pro", 16),
+                text=module.emoji,
+                font=self.fonts.get("SF Pro", 16),
                 width=30
             )
             module_emoji.pack(side="left")
@@ -421,8 +1285,8 @@ class LuxuryCookingApp:
             
             module_name = ctk.CTkLabel(
                 module_info,
-                text=module["name"],
-                font=("SF Pro Display", 13, "bold"),
+                text=module.name,
+                font=self.fonts.get("SF Pro Display", 13, "bold"),
                 text_color=self.text_color,
                 anchor="w"
             )
@@ -430,118 +1294,362 @@ class LuxuryCookingApp:
             
             module_action = ctk.CTkLabel(
                 module_info,
-                text=module["action"],
-                font=("SF Pro", 12),
+                text=module.action,
+                font=self.fonts.get("SF Pro", 12),
                 text_color=self.secondary_text,
                 anchor="w"
             )
             module_action.pack(anchor="w")
         
         cook_button = ctk.CTkButton(
-            self.recipe_detail_view,
+            page,
             text="START COOKING",
             command=self.start_cooking,
-            font=("SF Pro Display", 16, "bold"),
+            font=self.fonts.get("SF Pro Display", 16, "bold"),
             fg_color=self.accent_color,
             hover_color="#E64A00",
             height=50,
             corner_radius=25
         )
         cook_button.pack(pady=15, padx=20, fill="x", side="bottom")
+        
+        return page
 
     def create_cooking_view(self):
         self.cooking_view = ctk.CTkFrame(self.content_area, fg_color=self.bg_color)
+        self.stations_view = ctk.CTkFrame(self.content_area, fg_color=self.bg_color)
+        self.stations_built = False
 
-    def show_recipe_cards(self):
+    def hide_views(self):
+        self.recipe_container.pack_forget()
         self.recipe_detail_view.pack_forget()
+        self.stations_view.pack_forget()
         self.cooking_view.pack_forget()
         
+        if self.current_cooking is not None and self.current_cooking.frame.winfo_exists():
+            self.current_cooking.frame.pack_forget()
+        self.active_station = None
+        self.cooking_model.cancel()
+
+    def show_recipe_cards(self):
+        self.hide_views()
+        
         self.recipe_container.pack(fill="both", expand=True, padx=0, pady=0)
 
+    def build_stations_view(self):
+        title_label = ctk.CTkLabel(
+            self.stations_view,
+            text="STATIONS",
+            font=self.fonts.get("SF Pro Display", 14, "bold"),
+            text_color=self.secondary_text
+        )
+        title_label.pack(anchor="w", padx=20, pady=(15, 10))
+        
+        tile_grid = ctk.CTkFrame(self.stations_view, fg_color="transparent")
+        tile_grid.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        
+        columns = 2 if len(self.stations) <= 4 else 4
+        rows = (len(self.stations) + columns - 1) // columns
+        for col in range(columns):
+            tile_grid.grid_columnconfigure(col, weight=1, uniform="station")
+        for row in range(rows):
+            tile_grid.grid_rowconfigure(row, weight=1, uniform="station")
+        
+        for i, station in enumerate(self.stations):
+            station.tile = StationTile(tile_grid, self, station)
+            row, col = divmod(i, columns)
+            station.tile.frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+        
+        self.stations_built = True
+
+    def show_stations(self):
+        self.hide_views()
+        
+        if not self.stations_built:
+            self.build_stations_view()
+        self.stations_view.pack(fill="both", expand=True, padx=0, pady=0)
+
+    def free_station(self):
+        for station in self.stations:
+            if not station.busy:
+                return station
+        return None
+
     def start_cooking(self):
-        recipe_name = self.current_recipe.get()
-        recipe = RecipeManager.RECIPES[recipe_name]
-        cooking_time = recipe['time'] * 60
+        try:
+            result = self.submit_recipe(self.current_recipe.get())
+        except (ValueError, RuntimeError) as error:
+            self.show_status(str(error).upper())
+            return
+        if "station" in result:
+            self.open_station(self.stations[result["station"] - 1])
+        else:
+            self.show_stations()
+
+    def submit_recipe(self, recipe_name):
+        if self.recipes is None or recipe_name not in self.recipes:
+            raise ValueError(f"unknown recipe {recipe_name}")
+        recipe = self.recipes.get(recipe_name)
+        stock = None
+        if self.inventory is not None:
+            stock = self.inventory.stock.copy()
+            self.inventory.deduct([(recipe_name, 1)])
         
-        self.recipe_container.pack_forget()
-        self.recipe_detail_view.pack_forget()
+        station = self.free_station()
+        if station is None:
+            order = self.orders.submit(recipe_name, recipe, self.connect_delay + cooking_engine.plan_duration(recipe))
+            result = {"order": order.order_id, "queued": len(self.orders)}
+            self.refresh_queue_status()
+        else:
+            try:
+                self.start_station(station, recipe_name, recipe)
+            except RuntimeError:
+                if stock is not None:
+                    self.inventory.stock = stock
+                raise
+            result = {"station": station.number}
+        if self.inventory is not None:
+            self.inventory.save(self.inventory_path)
+        return result
+
+    def start_station(self, station, recipe_name, recipe, elapsed=0.0):
+        last_recipe = station.last_recipe
+        connect_delay = self.connect_delay + self.orders.changeover(last_recipe, recipe_name)
         
-        for widget in self.cooking_view.winfo_children():
-            widget.destroy()
-            
+        station.reset()
+        station.recipe_name = recipe_name
+        station.last_recipe = recipe_name
+        station.state.update(CookingViewModel.INITIAL_STATE)
+        station.state["recipe"] = f"{recipe.icon} {recipe_name}"
+        self.publish_station(station)
+        try:
+            station.session = self.engine.start(
+                recipe_name,
+                recipe,
+                lambda event, station=station: self.on_cooking_event(station, event),
+                connect_delay,
+                elapsed
+            )
+        except RuntimeError:
+            station.reset()
+            station.last_recipe = last_recipe
+            self.publish_station(station)
+            raise
+        self.start_sensors(station)
+
+    def start_sensors(self, station):
+        if self.sensor_source is None:
+            return
+        source = self.sensor_source(lambda: station.active_modules)
+        station.sensor_history.clear()
+        station.sensors = pipeline = SensorPipeline(
+            source,
+            lambda snapshot: self.sensor_updates.put((station, pipeline, snapshot)),
+            self.sensor_rate
+        )
+        self.sensor_hub.add(pipeline)
+        if self.sensor_poll_id is None:
+            self.sensor_poll_id = self.root.after(SENSOR_POLL_INTERVAL, self.poll_sensors)
+
+    def stop_sensors(self, station):
+        if station.sensors is not None:
+            self.sensor_hub.remove(station.sensors)
+            station.sensors = None
+
+    def poll_sensors(self):
+        self.sensor_poll_id = None
+        while True:
+            try:
+                update = self.sensor_updates.get_nowait()
+            except queue.Empty:
+                break
+            self.on_sensor_update(*update)
+        if self.sensor_hub.pipelines:
+            self.sensor_poll_id = self.root.after(SENSOR_POLL_INTERVAL, self.poll_sensors)
+
+    def poll_control(self):
+        while True:
+            try:
+                command = self.control_commands.get_nowait()
+            except queue.Empty:
+                break
+            command()
+        self.root.after(CONTROL_POLL_INTERVAL, self.poll_control)
+
+    def on_sensor_update(self, station, pipeline, snapshot):
+        if station.sensors is not pipeline:
+            return
+        station.sensor_history.extend(snapshot["points"])
+        if station is self.active_station:
+            self.current_cooking.chart.extend(snapshot["points"])
+        temperature, motor_rpm = snapshot["mean"]
+        self.update_station(station, sensors=f"🌡 {temperature:.1f}°C   ⚙ {motor_rpm:.0f} RPM")
+
+    def dispatch_orders(self):
+        for station in self.stations:
+            if not self.orders:
+                break
+            if station.busy:
+                continue
+            order = self.orders.next_order(station.last_recipe)
+            try:
+                self.start_station(station, order.recipe_name, order.recipe)
+            except RuntimeError as error:
+                self.orders.requeue(order)
+                self.show_status(str(error).upper())
+                break
+            if station is self.active_station:
+                self.open_station(station)
+        self.refresh_queue_status()
+
+    def show_status(self, text):
+        if self.status_clear_id is not None:
+            self.root.after_cancel(self.status_clear_id)
+        self.status_label.configure(text=text)
+        self.status_clear_id = self.root.after(STATUS_TIMEOUT, self.clear_status)
+
+    def clear_status(self):
+        self.status_clear_id = None
+        self.status_label.configure(text="")
+
+    def refresh_queue_status(self):
+        if self.queue_refresh_id is not None:
+            self.root.after_cancel(self.queue_refresh_id)
+            self.queue_refresh_id = None
+        
+        if not self.orders:
+            self.queue_label.configure(text="")
+            return
+        
+        now = self.engine.clock.now()
+        waits = self.orders.estimate([(station.free_at(now), station.last_recipe) for station in self.stations])
+        wait = int(max(waits.values()))
+        self.queue_label.configure(text=f"QUEUE {len(self.orders)} · WAIT {cooking_engine.format_remaining(wait)}")
+        self.queue_refresh_id = self.root.after(1000, self.refresh_queue_status)
+
+    def open_station(self, station):
+        if station.recipe_name is None:
+            return
+        recipe = self.recipes.get(station.recipe_name)
+        
+        self.hide_views()
+        
+        key = ("cooking", station.recipe_name)
+        screen = self.view_cache.get(key)
+        fresh = screen is None
+        if fresh:
+            screen = self.build_cooking_screen(station.recipe_name, recipe)
+            self.view_cache.put(key, screen)
+        
+        self.current_cooking = screen
+        self.active_station = station
+        self.cooking_model.bind(screen, station.state, fresh)
+        if screen.chart is not None:
+            screen.chart.load(station.sensor_history)
+        
+        screen.frame.pack(fill="both", expand=True, padx=0, pady=0)
         self.cooking_view.pack(fill="both", expand=True, padx=0, pady=0)
+        self.animator.wake()
+
+    def build_cooking_screen(self, recipe_name, recipe):
+        screen = CookingScreen(ctk.CTkFrame(self.cooking_view, fg_color=self.bg_color, corner_radius=0))
+        screen.color = recipe.color
         
-        top_bar = ctk.CTkFrame(self.cooking_view, fg_color=self.gradient_top, height=60)
+        top_bar = ctk.CTkFrame(screen.frame, fg_color=self.gradient_top, height=60)
         top_bar.pack(fill="x")
         top_bar.pack_propagate(False)
         
         recipe_title = ctk.CTkLabel(
             top_bar,
-            text=f"{recipe['icon']} {recipe_name}",
-            font=("SF Pro Display", 18, "bold"),
+            text=f"{recipe.icon} {recipe_name}",
+            font=self.fonts.get("SF Pro Display", 18, "bold"),
             text_color=self.text_color
         )
         recipe_title.pack(side="left", padx=20)
         
-        self.status_label = ctk.CTkLabel(
+        screen.status_label = ctk.CTkLabel(
             top_bar,
-            text="INITIALIZING...",
-            font=("SF Pro Display", 14),
+            text=CookingViewModel.INITIAL_STATE["status"],
+            font=self.fonts.get("SF Pro Display", 14),
             text_color=self.accent_color
         )
-        self.status_label.pack(side="right", padx=20)
+        screen.status_label.pack(side="right", padx=20)
+        
+        control_bar = ctk.CTkFrame(screen.frame, fg_color=self.gradient_top, height=90)
+        control_bar.pack(fill="x", side="bottom")
+        control_bar.pack_propagate(False)
         
-        content_area = ctk.CTkFrame(self.cooking_view, fg_color="transparent")
+        content_area = ctk.CTkFrame(screen.frame, fg_color="transparent")
         content_area.pack(fill="both", expand=True, padx=0, pady=0)
         
-        self.active_module_frame = ctk.CTkFrame(
+        active_module_frame = ctk.CTkFrame(
             content_area,
             fg_color=self.card_color,
             corner_radius=20,
             border_width=1,
             border_color=self.card_border
         )
-        self.active_module_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        active_module_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        progress_ring = ctk.CTkProgressBar(
-            self.active_module_frame,
+        screen.progress_ring = ctk.CTkProgressBar(
+            active_module_frame,
             mode="indeterminate",
             width=100,
             height=10,
             fg_color="#232323",
-            progress_color=recipe["color"],
+            progress_color=recipe.color,
             corner_radius=5
         )
-        progress_ring.pack(pady=(40, 0))
-        progress_ring.start()
+        screen.progress_ring.pack(pady=(40, 0))
+        self.animator.add(screen.progress_ring)
         
-        self.active_module_emoji = ctk.CTkLabel(
-            self.active_module_frame,
-            text="🔄",
-            font=("SF Pro", 100)
+        screen.active_module_emoji = ctk.CTkLabel(
+            active_module_frame,
+            text="",
+            font=self.fonts.get("SF Pro", 100)
         )
-        self.active_module_emoji.pack(pady=(10, 10))
+        self.set_glyph(screen.active_module_emoji, CookingViewModel.INITIAL_STATE["emoji"], 100)
+        screen.active_module_emoji.pack(pady=(10, 10))
         
-        self.active_module_name = ctk.CTkLabel(
-            self.active_module_frame,
-            text="INITIALIZING",
-            font=("SF Pro Display", 24, "bold"),
+        screen.active_module_name = ctk.CTkLabel(
+            active_module_frame,
+            text=CookingViewModel.INITIAL_STATE["module_name"],
+            font=self.fonts.get("SF Pro Display", 24, "bold"),
             text_color=self.text_color
         )
-        self.active_module_name.pack()
+        screen.active_module_name.pack()
         
-        self.active_module_action = ctk.CTkLabel(
-            self.active_module_frame,
-            text="Preparing to cook...",
-            font=("SF Pro", 16),
-            text_color=self.secondary_text
+        screen.active_module_action = ctk.CTkLabel(
+            active_module_frame,
+            text=CookingViewModel.INITIAL_STATE["module_action"],
+            font=self.fonts.get("SF Pro", 16),
+            text_color=self.secondary_text,
+            wraplength=600
         )
-        self.active_module_action.pack(pady=5)
+        screen.active_module_action.pack(pady=5)
         
-        status_frame = ctk.CTkFrame(self.active_module_frame, fg_color="transparent")
+        if self.sensor_source is not None:
+            screen.sensor_label = ctk.CTkLabel(
+                active_module_frame,
+                text="",
+                font=self.fonts.get("SF Pro Display", 14),
+                text_color=self.text_color
+            )
+            screen.sensor_label.pack()
+        
+        status_frame = ctk.CTkFrame(active_module_frame, fg_color="transparent")
         status_frame.pack(pady=10)
         
-        for i, module in enumerate(recipe["modules"]):
+        if self.sensor_source is not None:
+            screen.chart = LiveChart(
+                active_module_frame,
+                self,
+                (("TEMP °C", self.accent_color, 0, 120), ("RPM", "#45B7D1", 0, 150)),
+                window=min(SENSOR_WINDOW, max(60, math.ceil(cooking_engine.plan_duration(recipe) + self.connect_delay)))
+            )
+            screen.chart.canvas.pack(pady=(0, 10))
+        
+        for i, module in enumerate(recipe.modules):
             status_dot = ctk.CTkButton(
                 status_frame,
                 text="",
@@ -552,117 +1660,152 @@ class LuxuryCookingApp:
                 hover_color="#333333"
             )
             status_dot.pack(side="left", padx=5)
+            screen.status_dots.append(status_dot)
         
-        control_bar = ctk.CTkFrame(self.cooking_view, fg_color=self.gradient_top, height=90)
-        control_bar.pack(fill="x", side="bottom")
-        control_bar.pack_propagate(False)
-        
-        self.progress = ctk.CTkProgressBar(
+        screen.progress = ctk.CTkProgressBar(
             control_bar, 
             width=700, 
             height=8,
             fg_color="#232323",
-            progress_color=recipe["color"],
+            progress_color=recipe.color,
             corner_radius=4
         )
-        self.progress.pack(padx=20, pady=(15, 5), fill="x")
-        self.progress.set(0)
+        screen.progress.pack(padx=20, pady=(15, 5), fill="x")
+        screen.progress.set(CookingViewModel.INITIAL_STATE["progress"])
         
         time_frame = ctk.CTkFrame(control_bar, fg_color="transparent")
         time_frame.pack(fill="x", padx=20)
         
-        self.time_remaining = ctk.CTkLabel(
+        screen.time_remaining = ctk.CTkLabel(
             time_frame,
-            text="0:30",
-            font=("SF Pro Display", 16, "bold"),
+            text=CookingViewModel.INITIAL_STATE["time_remaining"],
+            font=self.fonts.get("SF Pro Display", 16, "bold"),
             text_color=self.text_color
         )
-        self.time_remaining.pack(side="left")
+        screen.time_remaining.pack(side="left")
         
-        self.stop_button = ctk.CTkButton(
+        screen.stop_button = ctk.CTkButton(
             time_frame, 
             text="STOP",
             command=self.stop_cooking,
-            font=("SF Pro Display", 14, "bold"),
+            font=self.fonts.get("SF Pro Display", 14, "bold"),
             fg_color=self.danger_color,
             hover_color="#D32F2F",
             corner_radius=15,
             width=80,
             height=30
         )
-        self.stop_button.pack(side="right", pady=5)
+        screen.stop_button.pack(side="right", pady=5)
         
-        self.is_cooking = True
-        self.cooking_thread = threading.Thread(
-            target=self.cook_process, 
-            args=(cooking_time, recipe), 
-            daemon=True
-        )
-        self.cooking_thread.start()
+        return screen
 
-    def cook_process(self, total_time, recipe):
-        modules = recipe["modules"]
-        module_count = len(modules)
-        start_time = time.time()
-        
-        self.root.after(0, lambda: self.status_label.configure(text="CONNECTING MODULES"))
-        time.sleep(1)
-        
-        while self.is_cooking and time.time() - start_time < total_time:
-            elapsed = time.time() - start_time
-            progress = elapsed / total_time
-            remaining = int(total_time - elapsed)
-            
-            mins = remaining // 60
-            secs = remaining % 60
-            time_str = f"{mins}:{secs:02d}"
-            
-            active_module_index = min(int(progress * module_count * 1.5), module_count - 1)
-            active_module = modules[active_module_index]
-            
-            self.root.after(0, self.update_cooking_ui, 
-                          progress, 
-                          time_str, 
-                          active_module)
-            
-            time.sleep(0.1)
+    def on_cooking_event(self, station, event):
+        if self.journal is not None:
+            self.journal.record(station.number, event)
+        if event.kind == cooking_engine.CONNECTING:
+            self.update_station(station, status="CONNECTING MODULES", time_remaining=event.time_remaining)
+        elif event.kind == cooking_engine.PROGRESS:
+            station.active_modules = tuple(module.name for module in event.active)
+            self.update_cooking_ui(station, event.progress, event.time_remaining, event.active, event.module_states)
+        elif event.kind == cooking_engine.FINISHED:
+            self.stop_sensors(station)
+            self.finish_cooking(station, event)
+        elif event.kind == cooking_engine.STOPPED:
+            self.stop_sensors(station)
 
-        if self.is_cooking:
-            self.root.after(0, self.finish_cooking)
+    def update_station(self, station, **state):
+        station.state.update(state)
+        if station.tile is not None:
+            station.tile.update(**state)
+        if station is self.active_station:
+            self.cooking_model.update(**state)
+        if self.control_server is not None:
+            self.control_server.publish(station.number, state)
 
-    def update_cooking_ui(self, progress, time_remaining, active_module):
-        self.progress.set(progress)
-        self.time_remaining.configure(text=time_remaining)
-        
-        self.active_module_emoji.configure(text=active_module["emoji"])
-        self.active_module_name.configure(text=active_module["name"].upper())
-        self.active_module_action.configure(text=active_module["action"])
-        
-        self.status_label.configure(text="COOKING IN PROGRESS")
+    def publish_station(self, station):
+        if station.tile is not None:
+            station.tile.update(**station.state)
+        if self.control_server is not None:
+            self.control_server.publish(station.number, dict(station.state))
 
-    def finish_cooking(self):
-        self.is_cooking = False
-        self.progress.set(1)
-        self.time_remaining.configure(text="0:00")
-        self.status_label.configure(text="COOKING COMPLETE")
-        
-        self.active_module_emoji.configure(text="✅")
-        self.active_module_name.configure(text="FINISHED")
-        self.active_module_action.configure(text="Your meal is ready to enjoy!")
-        
-        self.stop_button.configure(
-            text="DONE",
-            fg_color=self.accent_color,
-            hover_color="#E64A00",
-            command=self.show_recipe_cards
+    def update_cooking_ui(self, station, progress, time_remaining, active_modules, module_states):
+        state = {
+            "progress": progress,
+            "time_remaining": time_remaining,
+            "module_states": module_states,
+            "status": "COOKING IN PROGRESS"
+        }
+        if active_modules:
+            state["emoji"] = active_modules[0].emoji
+            state["module_name"] = " + ".join(module.name.upper() for module in active_modules)
+            state["module_action"] = " · ".join(module.action for module in active_modules)
+        self.update_station(station, **state)
+
+    def finish_cooking(self, station, event):
+        station.session = None
+        self.dispatch_orders()
+        if station.busy:
+            return
+        self.update_station(
+            station,
+            progress=1,
+            time_remaining="0:00",
+            status="COOKING COMPLETE",
+            emoji="✅",
+            module_name="FINISHED",
+            module_action="Your meal is ready to enjoy!",
+            module_states=event.module_states,
+            finished=True
         )
 
     def stop_cooking(self):
-        self.is_cooking = False
+        if self.active_station is not None:
+            self.stop_station(self.active_station)
         self.show_recipe_cards()
+        self.dispatch_orders()
+
+    def stop_station(self, station):
+        if station.session is not None:
+            self.engine.stop(station.session)
+        station.reset()
+        self.publish_station(station)
+
+    def api_recipes(self):
+        if self.recipes is None:
+            return []
+        return [
+            {key: value for key, value in self.recipes.summary(name).items() if key != "file"}
+            for name in self.recipes.names()
+        ]
+
+    def api_stop(self, number):
+        if not 1 <= number <= len(self.stations):
+            raise ValueError(f"unknown station {number}")
+        station = self.stations[number - 1]
+        self.stop_station(station)
+        if station is self.active_station:
+            self.show_recipe_cards()
+        self.dispatch_orders()
+        return {"station": number}
 
     def run(self):
         self.root.mainloop()
+        self.close()
+
+    def close(self):
+        self.sensor_hub.stop()
+        if self.control_server is not None:
+            self.control_server.stop()
+        if self.journal is not None:
+            self.journal.close()
+        if hasattr(self.engine, "close"):
+            self.engine.close()
+        if self.profiler is not None:
+            self.profiler.uninstall()
+            self.profiler.save(self.profile_path)
+            print(self.profiler.report(), file=sys.stderr)
+        if self.telemetry is not None:
+            self.telemetry.close()
 
 def main():
     app = LuxuryCookingApp()